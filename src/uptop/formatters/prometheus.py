@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
+import math
 from typing import Any
 
 from pydantic import BaseModel
@@ -19,16 +21,63 @@ from uptop.models.base import MetricData, MetricType, PluginType, get_metric_typ
 from uptop.plugin_api.base import FormatterPlugin
 
 
+# Characters not allowed in Prometheus metric names
+_INVALID_METRIC_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+# Escapes for characters that are special inside label values
+_LABEL_VALUE_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", '"': '\\"'})
+
+
 def _utcnow() -> datetime:
     """Return current UTC time as timezone-aware datetime."""
     return datetime.now(UTC)
 
 
+@lru_cache(maxsize=1024)
+def _build_headers(
+    metric_name: str,
+    metric_type: MetricType | None,
+    include_help: bool,
+    include_type: bool,
+) -> tuple[str, ...]:
+    """Build the HELP and TYPE comment lines for a metric.
+
+    The same headers are emitted for every sample of a metric on every
+    format() call, so results are cached. The cache is bounded because
+    dict panes can produce new metric names on each scrape.
+
+    Args:
+        metric_name: Full metric name
+        metric_type: Optional Prometheus metric type
+        include_help: Whether to emit a HELP comment
+        include_type: Whether to emit a TYPE comment when the type is known
+
+    Returns:
+        Tuple of comment lines (may be empty)
+    """
+    headers: list[str] = []
+
+    # Add HELP comment if configured
+    if include_help:
+        headers.append(f"# HELP {metric_name} {metric_name}")
+
+    # Add TYPE comment if configured and known
+    if include_type and metric_type:
+        prom_type = "gauge" if metric_type == MetricType.GAUGE else "counter"
+        headers.append(f"# TYPE {metric_name} {prom_type}")
+
+    return tuple(headers)
+
+
+@lru_cache(maxsize=1024)
 def _sanitize_metric_name(name: str) -> str:
     """Sanitize a metric name to comply with Prometheus naming conventions.
 
     Prometheus metric names must match [a-zA-Z_:][a-zA-Z0-9_:]*
 
+    The same few dozen names are emitted on every format() call, so
+    results are cached.
+
     Args:
         name: The raw metric name
 
@@ -36,9 +85,9 @@ def _sanitize_metric_name(name: str) -> str:
         Sanitized metric name
     """
     # Replace invalid characters with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    sanitized = _INVALID_METRIC_CHARS.sub("_", name)
     # Ensure it doesn't start with a digit
-    if sanitized and sanitized[0].isdigit():
+    if sanitized[:1].isdigit():
         sanitized = "_" + sanitized
     return sanitized
 
@@ -55,7 +104,29 @@ def _sanitize_label_value(value: str) -> str:
     Returns:
         Escaped label value
     """
-    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    # Most values (interface names, mount points) need no escaping
+    if "\\" not in value and "\n" not in value and '"' not in value:
+        return value
+    return value.translate(_LABEL_VALUE_ESCAPES)
+
+
+def _format_value(value: int | float) -> str:
+    """Format a sample value for Prometheus output.
+
+    Finite values use Python's shortest round-trip form. Non-finite floats
+    use the exposition format spellings instead of Python's nan/inf.
+
+    Args:
+        value: The numeric sample value
+
+    Returns:
+        Value string for a metric line
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        if math.isnan(value):
+            return "NaN"
+        return "+Inf" if value > 0 else "-Inf"
+    return str(value)
 
 
 def _format_labels(labels: dict[str, str]) -> str:
@@ -69,6 +140,9 @@ def _format_labels(labels: dict[str, str]) -> str:
     """
     if not labels:
         return ""
+    if len(labels) == 1:
+        ((k, v),) = labels.items()
+        return f'{{{k}="{_sanitize_label_value(str(v))}"}}'
     pairs = [f'{k}="{_sanitize_label_value(str(v))}"' for k, v in labels.items()]
     return "{" + ",".join(pairs) + "}"
 
@@ -159,75 +233,66 @@ class PrometheusFormatter(FormatterPlugin):
         panes = data.get("panes", {})
 
         for pane_name, pane_data in panes.items():
-            pane_lines = self._format_pane(pane_name, pane_data, base_labels, timestamp_ms)
-            lines.extend(pane_lines)
+            self._format_pane(lines, pane_name, pane_data, base_labels, timestamp_ms)
 
         return "\n".join(lines) + "\n" if lines else ""
 
     def _format_pane(
         self,
+        lines: list[str],
         pane_name: str,
         pane_data: MetricData | dict[str, Any],
         base_labels: dict[str, str],
         timestamp_ms: int | None = None,
-    ) -> list[str]:
+    ) -> None:
         """Format a single pane's data as Prometheus metrics.
 
         Args:
+            lines: Output buffer that metric lines are appended to
             pane_name: Name of the pane (e.g., "cpu", "memory")
             pane_data: The pane's MetricData or dict
             base_labels: Labels to add to all metrics
             timestamp_ms: Optional timestamp in milliseconds
-
-        Returns:
-            List of Prometheus metric lines
         """
-        lines: list[str] = []
-
         if isinstance(pane_data, MetricData):
-            data_dict = pane_data.model_dump()
+            # Shallow field view; nested models are walked in place, not dumped
+            data_dict = dict(pane_data)
             schema_class = type(pane_data)
         elif isinstance(pane_data, dict):
             data_dict = pane_data
             schema_class = None
         else:
-            return lines
+            return
 
         # Process each field in the pane data
-        lines.extend(
-            self._format_dict(
-                prefix=f"{self._prefix}_{pane_name}",
-                data=data_dict,
-                base_labels=base_labels,
-                schema_class=schema_class,
-                timestamp_ms=timestamp_ms,
-            )
+        self._format_dict(
+            lines,
+            prefix=f"{self._prefix}_{pane_name}",
+            data=data_dict,
+            base_labels=base_labels,
+            schema_class=schema_class,
+            timestamp_ms=timestamp_ms,
         )
 
-        return lines
-
     def _format_dict(
         self,
+        lines: list[str],
         prefix: str,
         data: dict[str, Any],
         base_labels: dict[str, str],
         schema_class: type[BaseModel] | None = None,
         timestamp_ms: int | None = None,
-    ) -> list[str]:
+    ) -> None:
         """Format a dictionary of values as Prometheus metrics.
 
         Args:
+            lines: Output buffer that metric lines are appended to
             prefix: Metric name prefix
             data: Dictionary of field name -> value
             base_labels: Labels to add to all metrics
             schema_class: Optional Pydantic model class for type metadata
             timestamp_ms: Optional timestamp in milliseconds
-
-        Returns:
-            List of Prometheus metric lines
         """
-        lines: list[str] = []
-
         for field_name, value in data.items():
             # Skip metadata fields
             if field_name in ("timestamp", "source"):
@@ -242,107 +307,86 @@ class PrometheusFormatter(FormatterPlugin):
 
             if isinstance(value, (int, float)) and not isinstance(value, bool):
                 # Scalar numeric value
-                lines.extend(
-                    self._format_scalar(
-                        metric_name, value, base_labels, metric_type, timestamp_ms
-                    )
+                self._format_scalar(
+                    lines, metric_name, value, base_labels, metric_type, timestamp_ms
                 )
 
             elif isinstance(value, list):
                 # List of items (e.g., CPU cores, interfaces)
-                lines.extend(
-                    self._format_list(
-                        metric_name, value, base_labels, timestamp_ms
-                    )
-                )
+                self._format_list(lines, metric_name, value, base_labels, timestamp_ms)
 
             elif isinstance(value, dict):
                 # Nested object
-                lines.extend(
-                    self._format_dict(
-                        metric_name, value, base_labels, None, timestamp_ms
-                    )
-                )
+                self._format_dict(lines, metric_name, value, base_labels, None, timestamp_ms)
 
             elif isinstance(value, BaseModel):
                 # Nested Pydantic model
-                lines.extend(
-                    self._format_dict(
-                        metric_name,
-                        value.model_dump(),
-                        base_labels,
-                        type(value),
-                        timestamp_ms,
-                    )
+                self._format_dict(
+                    lines,
+                    metric_name,
+                    dict(value),
+                    base_labels,
+                    type(value),
+                    timestamp_ms,
                 )
 
-        return lines
-
     def _format_scalar(
         self,
+        lines: list[str],
         metric_name: str,
         value: int | float,
         labels: dict[str, str],
         metric_type: MetricType | None = None,
         timestamp_ms: int | None = None,
-    ) -> list[str]:
-        """Format a scalar metric value.
+    ) -> None:
+        """Format a scalar metric value as HELP, TYPE, and value lines.
 
         Args:
+            lines: Output buffer that metric lines are appended to
             metric_name: Full metric name
             value: The metric value
             labels: Labels for this metric
             metric_type: Optional Prometheus metric type
             timestamp_ms: Optional timestamp in milliseconds
-
-        Returns:
-            List of lines including HELP, TYPE, and value
         """
-        lines: list[str] = []
-
-        # Add HELP comment if configured
-        if self._include_help:
-            lines.append(f"# HELP {metric_name} {metric_name}")
-
-        # Add TYPE comment if configured and known
-        if self._include_type and metric_type:
-            prom_type = "gauge" if metric_type == MetricType.GAUGE else "counter"
-            lines.append(f"# TYPE {metric_name} {prom_type}")
+        lines.extend(
+            _build_headers(metric_name, metric_type, self._include_help, self._include_type)
+        )
 
         # Format the metric line
         label_str = _format_labels(labels)
         if timestamp_ms is not None:
-            lines.append(f"{metric_name}{label_str} {value} {timestamp_ms}")
+            lines.append(f"{metric_name}{label_str} {_format_value(value)} {timestamp_ms}")
         else:
-            lines.append(f"{metric_name}{label_str} {value}")
-
-        return lines
+            lines.append(f"{metric_name}{label_str} {_format_value(value)}")
 
     def _format_list(
         self,
+        lines: list[str],
         metric_name: str,
         values: list[Any],
         base_labels: dict[str, str],
         timestamp_ms: int | None = None,
-    ) -> list[str]:
+    ) -> None:
         """Format a list of items as labeled metrics.
 
         Args:
+            lines: Output buffer that metric lines are appended to
             metric_name: Base metric name
             values: List of items to format
             base_labels: Labels to add to all metrics
             timestamp_ms: Optional timestamp in milliseconds
-
-        Returns:
-            List of Prometheus metric lines
         """
-        lines: list[str] = []
-
         for idx, item in enumerate(values):
+            if isinstance(item, BaseModel):
+                # Pydantic model in list; read its fields without dumping
+                item = dict(item)
+
             if isinstance(item, dict):
                 # Get identifier for this item (e.g., core id, interface name)
                 item_id = item.get("id", item.get("name", str(idx)))
-                item_labels = {**base_labels, "id": str(item_id)}
+                # Labels are the same for every field of the item
+                label_str = _format_labels({**base_labels, "id": str(item_id)})
 
                 for field_name, value in item.items():
                     if field_name in ("id", "name", "timestamp", "source"):
@@ -350,40 +394,19 @@ class PrometheusFormatter(FormatterPlugin):
 
                     if isinstance(value, (int, float)) and not isinstance(value, bool):
                         field_metric = _sanitize_metric_name(f"{metric_name}_{field_name}")
-                        label_str = _format_labels(item_labels)
-                        if timestamp_ms is not None:
-                            lines.append(f"{field_metric}{label_str} {value} {timestamp_ms}")
-                        else:
-                            lines.append(f"{field_metric}{label_str} {value}")
-
-            elif isinstance(item, BaseModel):
-                # Pydantic model in list
-                item_dict = item.model_dump()
-                item_id = item_dict.get("id", item_dict.get("name", str(idx)))
-                item_labels = {**base_labels, "id": str(item_id)}
-
-                for field_name, value in item_dict.items():
-                    if field_name in ("id", "name", "timestamp", "source"):
-                        continue
-
-                    if isinstance(value, (int, float)) and not isinstance(value, bool):
-                        field_metric = _sanitize_metric_name(f"{metric_name}_{field_name}")
-                        label_str = _format_labels(item_labels)
+                        value_str = _format_value(value)
                         if timestamp_ms is not None:
-                            lines.append(f"{field_metric}{label_str} {value} {timestamp_ms}")
+                            lines.append(f"{field_metric}{label_str} {value_str} {timestamp_ms}")
                         else:
-                            lines.append(f"{field_metric}{label_str} {value}")
+                            lines.append(f"{field_metric}{label_str} {value_str}")
 
             elif isinstance(item, (int, float)) and not isinstance(item, bool):
                 # Simple numeric list
-                item_labels = {**base_labels, "index": str(idx)}
-                label_str = _format_labels(item_labels)
+                label_str = _format_labels({**base_labels, "index": str(idx)})
                 if timestamp_ms is not None:
-                    lines.append(f"{metric_name}{label_str} {item} {timestamp_ms}")
+                    lines.append(f"{metric_name}{label_str} {_format_value(item)} {timestamp_ms}")
                 else:
-                    lines.append(f"{metric_name}{label_str} {item}")
-
-        return lines
+                    lines.append(f"{metric_name}{label_str} {_format_value(item)}")
 
     def get_ai_help_docs(self) -> str:
         """Return markdown documentation for --ai-help output.
@@ -10,6 +10,7 @@ This module defines the foundational data models that all uptop components use:
 
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -189,9 +190,14 @@ def summary_field(description: str = "", **kwargs: Any) -> Any:
     return _metric_field(MetricType.SUMMARY, description, **kwargs)
 
 
+@lru_cache(maxsize=512)
 def get_metric_type(model: type[BaseModel], field_name: str) -> MetricType | None:
     """Extract the metric type from a model field.
 
+    Results are cached per (model, field_name) since model schemas do not
+    change at runtime. Call ``get_metric_type.cache_clear()`` if plugin
+    models are unloaded.
+
     Args:
         model: The Pydantic model class
         field_name: Name of the field to inspect
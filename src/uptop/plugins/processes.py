@@ -77,6 +77,70 @@ class ProcessListData(MetricData):
     running_count: int = gauge_field("Number of running processes", default=0, ge=0)
 
 
+def _join_cmdline(cmdline_raw: list[str] | str | None) -> str | None:
+    """Normalize a psutil command line to a single string.
+
+    Args:
+        cmdline_raw: Argument list from psutil, an already joined string, or None
+
+    Returns:
+        Space-joined command line with surrounding whitespace stripped (as
+        MetricData validation would), or None if it is missing or empty
+    """
+    if cmdline_raw is None:
+        return None
+    if isinstance(cmdline_raw, list):
+        # Processes that rewrite argv often leave trailing empty arguments
+        return " ".join(cmdline_raw).strip() if cmdline_raw else None
+    return str(cmdline_raw).strip()
+
+
+def _build_process_info(info: dict[str, Any], status: str, source: str) -> ProcessInfo:
+    """Build a ProcessInfo from a psutil ``Process.info`` dict.
+
+    psutil output is trusted, so the model is built with ``model_construct``
+    to skip per-field validation on the collection hot path. The values are
+    normalized here instead so that the invariants ProcessInfo validates
+    (non-negative sizes, memory_percent within 0-100, strings stripped of
+    surrounding whitespace) still hold. Code handling untrusted input
+    should keep using ``ProcessInfo(...)``.
+
+    Args:
+        info: Attribute dict from ``psutil.process_iter(attrs=...)``
+        status: Process status string
+        source: Collector name recorded on the model
+
+    Returns:
+        ProcessInfo for the process
+    """
+    # Extract memory info
+    memory_info = info.get("memory_info")
+    rss = 0
+    vms = 0
+    if memory_info is not None:
+        rss = getattr(memory_info, "rss", 0) or 0
+        vms = getattr(memory_info, "vms", 0) or 0
+
+    cmdline = _join_cmdline(info.get("cmdline"))
+
+    memory_percent = info.get("memory_percent", 0.0) or 0.0
+
+    return ProcessInfo.model_construct(
+        pid=max(0, info.get("pid", 0) or 0),
+        name=(info.get("name", "") or "").strip(),
+        username=(info.get("username", "") or "").strip(),
+        cpu_percent=max(0.0, info.get("cpu_percent", 0.0) or 0.0),
+        memory_percent=min(max(0.0, memory_percent), 100.0),
+        memory_rss_bytes=max(0, rss),
+        memory_vms_bytes=max(0, vms),
+        status=status.strip(),
+        create_time=max(0.0, info.get("create_time", 0.0) or 0.0),
+        cmdline=cmdline,
+        num_threads=max(0, info.get("num_threads", 1) or 1),
+        source=source,
+    )
+
+
 class ProcessCollector(DataCollector[ProcessListData]):
     """Collector for system process information.
 
@@ -94,7 +158,8 @@ class ProcessCollector(DataCollector[ProcessListData]):
     default_interval = 2.0
     timeout = 10.0
 
-    # Process attributes to collect via psutil
+    # Process attributes to collect via psutil. cmdline is read separately
+    # and cached, since it only changes when a process execs.
     PROCESS_ATTRS = [
         "pid",
         "name",
@@ -104,10 +169,44 @@ class ProcessCollector(DataCollector[ProcessListData]):
         "memory_info",
         "status",
         "create_time",
-        "cmdline",
         "num_threads",
     ]
 
+    def __init__(self) -> None:
+        """Initialize the collector with an empty command line cache."""
+        super().__init__()
+        self._cmdline_cache: dict[tuple[int, float, str], str | None] = {}
+
+    def _get_cmdline(
+        self,
+        proc: psutil.Process,
+        info: dict[str, Any],
+        seen: dict[tuple[int, float, str], str | None],
+    ) -> str | None:
+        """Get a process command line, reusing the value from the last collection.
+
+        The cache key includes the process name so that a process which execs
+        a new program (same PID and create time) is re-read.
+
+        Args:
+            proc: psutil Process to read from on a cache miss
+            info: Attribute dict already collected for the process
+            seen: Cache entries for this collection, filled in as processes are seen
+
+        Returns:
+            Joined command line, or None if it is empty or cannot be read
+        """
+        key = (info.get("pid", 0), info.get("create_time", 0.0), info.get("name", ""))
+        if key in self._cmdline_cache:
+            cmdline = self._cmdline_cache[key]
+        else:
+            try:
+                cmdline = _join_cmdline(proc.cmdline())
+            except (psutil.ZombieProcess, psutil.AccessDenied):
+                cmdline = None
+        seen[key] = cmdline
+        return cmdline
+
     async def collect(self) -> ProcessListData:
         """Collect current process data.
 
@@ -120,6 +219,7 @@ class ProcessCollector(DataCollector[ProcessListData]):
         """
         processes: list[ProcessInfo] = []
         running_count = 0
+        cmdline_cache: dict[tuple[int, float, str], str | None] = {}
 
         for proc in psutil.process_iter(attrs=self.PROCESS_ATTRS):
             try:
@@ -127,42 +227,14 @@ class ProcessCollector(DataCollector[ProcessListData]):
                 if info is None:
                     continue
 
-                # Extract memory info
-                memory_info = info.get("memory_info")
-                rss = 0
-                vms = 0
-                if memory_info is not None:
-                    rss = getattr(memory_info, "rss", 0) or 0
-                    vms = getattr(memory_info, "vms", 0) or 0
-
-                # Handle cmdline - it may be a list or None
-                cmdline_raw = info.get("cmdline")
-                cmdline = None
-                if cmdline_raw is not None:
-                    if isinstance(cmdline_raw, list):
-                        cmdline = " ".join(cmdline_raw) if cmdline_raw else None
-                    else:
-                        cmdline = str(cmdline_raw)
+                info["cmdline"] = self._get_cmdline(proc, info, cmdline_cache)
 
                 # Get status and count running processes
                 status = info.get("status", "unknown") or "unknown"
                 if status == psutil.STATUS_RUNNING:
                     running_count += 1
 
-                process_info = ProcessInfo(
-                    pid=info.get("pid", 0) or 0,
-                    name=info.get("name", "") or "",
-                    username=info.get("username", "") or "",
-                    cpu_percent=info.get("cpu_percent", 0.0) or 0.0,
-                    memory_percent=info.get("memory_percent", 0.0) or 0.0,
-                    memory_rss_bytes=rss,
-                    memory_vms_bytes=vms,
-                    status=status,
-                    create_time=info.get("create_time", 0.0) or 0.0,
-                    cmdline=cmdline,
-                    num_threads=info.get("num_threads", 1) or 1,
-                    source=self.name,
-                )
+                process_info = _build_process_info(info, status, self.name)
                 processes.append(process_info)
 
             except (psutil.AccessDenied, psutil.NoSuchProcess):
@@ -172,6 +244,9 @@ class ProcessCollector(DataCollector[ProcessListData]):
                 # Zombie process or attribute error - skip it
                 continue
 
+        # Only keep command lines for processes that still exist
+        self._cmdline_cache = cmdline_cache
+
         return ProcessListData(
             processes=processes,
             total_count=len(processes),
@@ -8,7 +8,7 @@ This module provides the central plugin management system including:
 - Dependency injection for plugin initialization
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 import importlib
 import importlib.metadata
 import importlib.util
@@ -16,9 +16,10 @@ import logging
 from pathlib import Path
 import sys
 import traceback
+from types import MappingProxyType
 from typing import Any, TypeVar
 
-from uptop.models.base import PluginMetadata, PluginType
+from uptop.models.base import PluginMetadata, PluginType, get_metric_type
 from uptop.plugin_api.base import (
     API_VERSION,
     ActionPlugin,
@@ -178,9 +179,12 @@ class PluginRegistry:
         return self._started
 
     @property
-    def failed_plugins(self) -> dict[str, str]:
-        """Return dict of failed plugin names to error messages."""
-        return self._failed_plugins.copy()
+    def failed_plugins(self) -> Mapping[str, str]:
+        """Return a read-only view of failed plugin names to error messages.
+
+        The view reflects later failures; copy it with dict() to keep a snapshot.
+        """
+        return MappingProxyType(self._failed_plugins)
 
     def discover_all(self, strict: bool = False) -> list[PluginMetadata]:
         """Discover plugins from all sources.
@@ -1009,6 +1013,8 @@ class PluginRegistry:
         self._plugin_classes.clear()
         self._metadata.clear()
         self._failed_plugins.clear()
+        # Drop cached metric types that reference unloaded plugin schemas
+        get_metric_type.cache_clear()
         logger.debug("Registry cleared")
 
     def __len__(self) -> int:
@@ -18,11 +18,13 @@ The widget supports:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from enum import Enum
+from operator import attrgetter
 import platform
 import subprocess
 import time
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from textual.app import ComposeResult
 from textual.message import Message
@@ -34,6 +36,8 @@ from textual.widgets.data_table import RowKey
 from uptop.models.base import DisplayMode
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from uptop.plugins.processes import ProcessInfo, ProcessListData
 
 
@@ -125,6 +129,24 @@ COLUMN_CONFIG: dict[ProcessColumn, tuple[str, int | None, bool]] = {
     ProcessColumn.COMMAND: ("Command", None, True),  # None = flexible width
 }
 
+# Process attribute sorted on for each column (User and Command sort
+# case-insensitively and are handled in ProcessWidget._get_sort_key)
+_SORT_ATTRS: dict[ProcessColumn, str] = {
+    ProcessColumn.PID: "pid",
+    ProcessColumn.CPU: "cpu_percent",
+    ProcessColumn.MEM: "memory_percent",
+    ProcessColumn.VSZ: "memory_vms_bytes",
+    ProcessColumn.RSS: "memory_rss_bytes",
+    ProcessColumn.STATE: "status",
+    ProcessColumn.RUNTIME: "create_time",
+}
+
+# Column keys in row order, paired with whether the column sizes to its content
+# (those cells ask the DataTable to re-measure when updated in place)
+_ROW_COLUMNS: tuple[tuple[str, bool], ...] = tuple(
+    (column.value, COLUMN_CONFIG[column][1] is None) for column in ProcessColumn
+)
+
 # Sort cycling order: CPU% -> MEM% -> PID -> User -> Command -> (repeat)
 SORT_CYCLE_ORDER: list[ProcessColumn] = [
     ProcessColumn.CPU,
@@ -149,6 +171,40 @@ STATE_STYLES: dict[str, tuple[str, str]] = {
 }
 
 
+# Byte unit suffixes and divisors, indexed by power of 1024
+_BYTE_UNITS: tuple[tuple[str, int], ...] = (
+    ("", 1),
+    ("K", 1024),
+    ("M", 1024**2),
+    ("G", 1024**3),
+    ("T", 1024**4),
+)
+
+
+def _build_filter_haystack(processes: list[ProcessInfo]) -> tuple[str, list[int]]:
+    """Build the lowercased search text used for process filtering.
+
+    Each process contributes ``name\\x01cmdline\\x01username`` lowercased in a
+    single call, and processes are joined with NUL separators so one substring
+    scan covers every searchable field of every process.
+
+    Args:
+        processes: Processes to index
+
+    Returns:
+        Tuple of (joined text, start offset of each process within the text)
+    """
+    parts: list[str] = []
+    starts: list[int] = []
+    offset = 0
+    for proc in processes:
+        part = f"{proc.name}\x01{proc.cmdline or ''}\x01{proc.username}".lower()
+        parts.append(part)
+        starts.append(offset)
+        offset += len(part) + 1
+    return "\0".join(parts), starts
+
+
 def format_bytes(size_bytes: int) -> str:
     """Format bytes as human-readable string.
 
@@ -162,25 +218,27 @@ def format_bytes(size_bytes: int) -> str:
     if size_bytes < 0:
         return "0"
 
-    units = [("T", 1024**4), ("G", 1024**3), ("M", 1024**2), ("K", 1024)]
-
-    for suffix, threshold in units:
-        if size_bytes >= threshold:
-            value = size_bytes / threshold
-            if value >= 100:
-                return f"{int(value)}{suffix}"
-            if value >= 10:
-                return f"{value:.1f}{suffix}"
-            return f"{value:.2f}{suffix}"
+    # Each unit is 2**10 larger, so the bit length selects the unit directly
+    tier = min((int(size_bytes).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    if tier <= 0:
+        return str(size_bytes)
 
-    return str(size_bytes)
+    suffix, threshold = _BYTE_UNITS[tier]
+    value = size_bytes / threshold
+    if value >= 100:
+        return f"{int(value)}{suffix}"
+    if value >= 10:
+        return f"{value:.1f}{suffix}"
+    return f"{value:.2f}{suffix}"
 
 
-def format_runtime(create_time: float) -> str:
+def format_runtime(create_time: float, now: float | None = None) -> str:
     """Format process runtime as HH:MM:SS.
 
     Args:
         create_time: Unix timestamp of process creation
+        now: Current Unix timestamp (read from the clock if None). Pass a
+            single snapshot when formatting many rows.
 
     Returns:
         Runtime string in HH:MM:SS format
@@ -188,7 +246,8 @@ def format_runtime(create_time: float) -> str:
     if create_time <= 0:
         return "00:00:00"
 
-    now = time.time()
+    if now is None:
+        now = time.time()
     elapsed = max(0, now - create_time)
 
     hours = int(elapsed // 3600)
@@ -396,6 +455,8 @@ class ProcessWidget(Widget):
         self.command_max_length = command_max_length
         self._data: ProcessListData | None = None
         self._pid_to_row_key: dict[int, RowKey] = {}
+        self._last_rows: dict[int, tuple] = {}
+        self._filter_haystack: tuple[list[ProcessInfo], str, list[int]] | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the widget with DataTable and summary bar."""
@@ -404,7 +465,7 @@ class ProcessWidget(Widget):
                 # Ultra-compact: single line with process count
                 if self._data:
                     total = len(self._data.processes)
-                    running = sum(1 for p in self._data.processes if p.status == "running")
+                    running = self._data.running_count
                     yield Label(f"Procs {total} ({running} run)", classes="micro-label")
                 else:
                     yield Label("Procs --", classes="micro-label")
@@ -432,6 +493,7 @@ class ProcessWidget(Widget):
         if self._display_mode != DisplayMode.MICRO:
             table = self.query_one("#process-table", DataTable)
             self._setup_columns(table)
+            self._last_rows = {}
 
         # If data was set before mounting, apply it now
         if self._data is not None:
@@ -455,43 +517,31 @@ class ProcessWidget(Widget):
             else:
                 table.add_column(display_name, key=column.value)
 
-    def _get_sort_key(self, proc: ProcessInfo) -> tuple:
-        """Get sort key for a process.
+    def _get_sort_key(self) -> Callable[[ProcessInfo], Any]:
+        """Get the sort key function for the current sort column.
 
-        Args:
-            proc: Process info to get key for
+        Numeric and exact-match columns sort on a single attribute via
+        ``operator.attrgetter``, so ``sorted`` reads one field per process in C
+        instead of dispatching on the column for every comparison key.
 
         Returns:
-            Tuple for sorting
+            Key function for sorting processes
         """
         column = self.sort_column
 
-        if column == ProcessColumn.PID:
-            return (proc.pid,)
         if column == ProcessColumn.USER:
-            return (proc.username.lower(),)
-        if column == ProcessColumn.CPU:
-            return (proc.cpu_percent,)
-        if column == ProcessColumn.MEM:
-            return (proc.memory_percent,)
-        if column == ProcessColumn.VSZ:
-            return (proc.memory_vms_bytes,)
-        if column == ProcessColumn.RSS:
-            return (proc.memory_rss_bytes,)
-        if column == ProcessColumn.STATE:
-            return (proc.status,)
-        if column == ProcessColumn.RUNTIME:
-            return (proc.create_time,)
+            return lambda proc: proc.username.lower()
         if column == ProcessColumn.COMMAND:
-            return ((proc.cmdline or proc.name).lower(),)
+            return lambda proc: (proc.cmdline or proc.name).lower()
 
-        return (proc.cpu_percent,)  # Default
+        return attrgetter(_SORT_ATTRS.get(column, "cpu_percent"))
 
-    def _format_process_row(self, proc: ProcessInfo) -> tuple:
+    def _format_process_row(self, proc: ProcessInfo, now: float | None = None) -> tuple:
         """Format a process as a table row.
 
         Args:
             proc: Process info to format
+            now: Timestamp used for the runtime column (current time if None)
 
         Returns:
             Tuple of formatted cell values
@@ -508,7 +558,7 @@ class ProcessWidget(Widget):
             f"{format_bytes(proc.memory_vms_bytes):>7}",
             f"{format_bytes(proc.memory_rss_bytes):>7}",
             state_symbol,
-            f"{format_runtime(proc.create_time):>10}",
+            f"{format_runtime(proc.create_time, now):>10}",
             format_command(proc.cmdline, proc.name),
         )
 
@@ -546,7 +596,7 @@ class ProcessWidget(Widget):
             try:
                 label = self.query_one(".micro-label", Label)
                 total = len(data.processes)
-                running = sum(1 for p in data.processes if p.status == "running")
+                running = data.running_count
                 label.update(f"Procs {total} ({running} run)")
             except Exception:
                 pass  # Label not found or not mounted yet
@@ -556,36 +606,36 @@ class ProcessWidget(Widget):
         summary = self.query_one("#summary-bar", Label)
 
         # Filter processes first
-        filtered_processes = [p for p in data.processes if self._matches_filter(p)]
-
-        # Save scroll position and cursor before clearing
-        saved_scroll_x = table.scroll_x
-        saved_scroll_y = table.scroll_y
-        saved_cursor_row = table.cursor_row
+        filtered_processes = data.processes
+        if self.filter_text:
+            filtered_processes = self._apply_filter(
+                data.processes,
+                self.filter_text,
+                self._get_filter_haystack(data.processes),
+            )
 
-        # Clear and rebuild table
-        table.clear()
-        self._pid_to_row_key.clear()
+        # Snapshot the clock once so every row's runtime uses the same instant
+        now = time.time()
 
+        # Format rows in display order, keyed by PID
         if self.tree_view:
-            # Tree view mode
-            tree_data = self._build_process_tree(filtered_processes)
-            for proc, indent_level in tree_data:
-                row_key = table.add_row(
-                    *self._format_process_row_tree(proc, indent_level),
-                    key=str(proc.pid),
-                )
-                self._pid_to_row_key[proc.pid] = row_key
+            rows = {
+                proc.pid: self._format_process_row_tree(proc, indent_level, now)
+                for proc, indent_level in self._build_process_tree(filtered_processes)
+            }
         else:
-            # Flat list mode - sort processes
             sorted_processes = sorted(
                 filtered_processes,
-                key=self._get_sort_key,
+                key=self._get_sort_key(),
                 reverse=(self.sort_direction == SortDirection.DESCENDING),
             )
-            for proc in sorted_processes:
-                row_key = table.add_row(*self._format_process_row(proc), key=str(proc.pid))
-                self._pid_to_row_key[proc.pid] = row_key
+            rows = {proc.pid: self._format_process_row(proc, now) for proc in sorted_processes}
+
+        # Batch screen updates so the row changes are painted once
+        with self.app.batch_update():
+            if not self._update_rows_in_place(table, rows):
+                self._rebuild_table(table, rows)
+        self._last_rows = rows
 
         # Build summary parts
         summary_parts = [
@@ -606,6 +656,23 @@ class ProcessWidget(Widget):
         # Update summary
         summary.update(" | ".join(summary_parts))
 
+    def _rebuild_table(self, table: DataTable, rows: dict[int, tuple]) -> None:
+        """Clear the table and add every row, keeping the scroll position.
+
+        Args:
+            table: The DataTable to rebuild
+            rows: Formatted rows keyed by PID in display order
+        """
+        # Save scroll position and cursor before clearing
+        saved_scroll_x = table.scroll_x
+        saved_scroll_y = table.scroll_y
+        saved_cursor_row = table.cursor_row
+
+        table.clear()
+        self._pid_to_row_key.clear()
+        for pid, row in rows.items():
+            self._pid_to_row_key[pid] = table.add_row(*row, key=str(pid))
+
         # Restore scroll position and cursor after layout completes
         row_count = table.row_count
         has_position_to_restore = (
@@ -624,6 +691,49 @@ class ProcessWidget(Widget):
 
             self.call_after_refresh(restore_scroll)
 
+    def _update_rows_in_place(self, table: DataTable, rows: dict[int, tuple]) -> bool:
+        """Apply new rows to the table as a delta against the previous refresh.
+
+        Rows for vanished PIDs are removed, changed cells are updated and new
+        PIDs are appended. This only works when the surviving rows keep their
+        relative order and every new PID sorts after them; otherwise the
+        caller must rebuild the table.
+
+        Args:
+            table: The DataTable showing the previous rows
+            rows: Formatted rows for this refresh, keyed by PID in display order
+
+        Returns:
+            True if the table was updated, False if it needs a full rebuild
+        """
+        previous = self._last_rows
+        if not previous or table.row_count != len(previous):
+            return False
+
+        kept = [pid for pid in previous if pid in rows]
+        order = list(rows)
+        if order[: len(kept)] != kept:
+            return False
+
+        for pid in previous.keys() - rows.keys():
+            table.remove_row(self._pid_to_row_key.pop(pid))
+
+        for pid in kept:
+            old_row = previous[pid]
+            new_row = rows[pid]
+            if old_row == new_row:
+                continue
+            row_key = self._pid_to_row_key[pid]
+            for (column_key, auto_width), old_value, new_value in zip(
+                _ROW_COLUMNS, old_row, new_row, strict=True
+            ):
+                if old_value != new_value:
+                    table.update_cell(row_key, column_key, new_value, update_width=auto_width)
+
+        for pid in order[len(kept) :]:
+            self._pid_to_row_key[pid] = table.add_row(*rows[pid], key=str(pid))
+        return True
+
     def get_selected_pid(self) -> int | None:
         """Get the PID of the currently selected process.
 
@@ -835,23 +945,88 @@ class ProcessWidget(Widget):
         """
         if not self.filter_text:
             return True
+        return self._filter_mask([proc], self.filter_text)[0]
 
-        filter_lower = self.filter_text.lower()
+    @staticmethod
+    def _apply_filter(
+        processes: list[ProcessInfo],
+        filter_text: str,
+        haystack: tuple[str, list[int]] | None = None,
+    ) -> list[ProcessInfo]:
+        """Filter a process list by the given filter text.
 
-        # Check against PID (exact or prefix match)
-        if str(proc.pid).startswith(self.filter_text):
-            return True
+        Args:
+            processes: Processes to filter
+            filter_text: Text to match against PID, name, command line and user
+            haystack: Prebuilt search text for ``processes`` (built if omitted)
 
-        # Check against name
-        if filter_lower in proc.name.lower():
-            return True
+        Returns:
+            Processes matching the filter. With an empty filter the input list
+            itself is returned, since callers sort into a new list anyway.
+        """
+        if not filter_text:
+            return processes
+        mask = ProcessWidget._filter_mask(processes, filter_text, haystack)
+        return [p for p, keep in zip(processes, mask, strict=True) if keep]
+
+    @staticmethod
+    def _filter_mask(
+        processes: list[ProcessInfo],
+        filter_text: str,
+        haystack: tuple[str, list[int]] | None = None,
+    ) -> list[bool]:
+        """Compute which processes match the filter text in a single batch.
+
+        A process matches if its PID starts with the filter text, or if the
+        filter text appears (case-insensitively) in its name, command line or
+        username. The needle is lowercased once and searched with ``str.find``
+        over the prebuilt haystack, instead of lowercasing and searching every
+        field of every process.
 
-        # Check against command line
-        if proc.cmdline and filter_lower in proc.cmdline.lower():
-            return True
+        Args:
+            processes: Processes to check
+            filter_text: Non-empty text to match
+            haystack: Prebuilt search text for ``processes`` (built if omitted)
 
-        # Check against username
-        return filter_lower in proc.username.lower()
+        Returns:
+            One boolean per process, True where the process matches
+        """
+        mask = [str(p.pid).startswith(filter_text) for p in processes]
+        needle = filter_text.lower()
+        if "\0" in needle or "\x01" in needle:
+            # Separator characters in the needle could match across fields
+            return mask
+
+        text, starts = haystack if haystack is not None else _build_filter_haystack(processes)
+        pos = text.find(needle)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            mask[index] = True
+            # Skip the rest of this process; one hit is enough
+            if index + 1 >= len(starts):
+                break
+            pos = text.find(needle, starts[index + 1])
+
+        return mask
+
+    def _get_filter_haystack(self, processes: list[ProcessInfo]) -> tuple[str, list[int]]:
+        """Get the filter search text for a process list, reusing the last one.
+
+        The haystack only depends on the process list, so it is rebuilt when new
+        data arrives but reused while the user edits the filter text.
+
+        Args:
+            processes: Processes currently displayed
+
+        Returns:
+            Tuple of (joined text, start offset of each process within the text)
+        """
+        cached = self._filter_haystack
+        if cached is None or cached[0] is not processes:
+            text, starts = _build_filter_haystack(processes)
+            cached = (processes, text, starts)
+            self._filter_haystack = cached
+        return cached[1], cached[2]
 
     def _build_process_tree(self, processes: list[ProcessInfo]) -> list[tuple[ProcessInfo, int]]:
         """Build a tree structure from flat process list.
@@ -873,10 +1048,11 @@ class ProcessWidget(Widget):
             children[ppid].append(proc)
 
         # Sort children by the current sort criteria
+        sort_key = self._get_sort_key()
         for ppid in children:
             children[ppid] = sorted(
                 children[ppid],
-                key=self._get_sort_key,
+                key=sort_key,
                 reverse=(self.sort_direction == SortDirection.DESCENDING),
             )
 
@@ -900,7 +1076,7 @@ class ProcessWidget(Widget):
         # Sort roots by current sort criteria
         root_processes = sorted(
             root_processes,
-            key=self._get_sort_key,
+            key=sort_key,
             reverse=(self.sort_direction == SortDirection.DESCENDING),
         )
 
@@ -912,12 +1088,15 @@ class ProcessWidget(Widget):
 
         return result
 
-    def _format_process_row_tree(self, proc: ProcessInfo, indent_level: int) -> tuple:
+    def _format_process_row_tree(
+        self, proc: ProcessInfo, indent_level: int, now: float | None = None
+    ) -> tuple:
         """Format a process as a table row with tree indentation.
 
         Args:
             proc: Process info to format
             indent_level: Number of levels to indent (for tree view)
+            now: Timestamp used for the runtime column (current time if None)
 
         Returns:
             Tuple of formatted cell values
@@ -940,6 +1119,6 @@ class ProcessWidget(Widget):
             f"{format_bytes(proc.memory_vms_bytes):>7}",
             f"{format_bytes(proc.memory_rss_bytes):>7}",
             state_symbol,
-            f"{format_runtime(proc.create_time):>10}",
+            f"{format_runtime(proc.create_time, now):>10}",
             command_display,
         )
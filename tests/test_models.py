@@ -372,6 +372,17 @@ class TestGetMetricType:
         assert get_metric_type(TestData, "cpu_percent") == MetricType.GAUGE
         assert get_metric_type(TestData, "timestamp") is None  # Inherited, no metric type
 
+    def test_results_are_cached(self) -> None:
+        """Test repeated lookups for the same field are served from the cache."""
+
+        class TestData(MetricData):
+            bytes_sent: int = counter_field("Bytes sent")
+
+        get_metric_type(TestData, "bytes_sent")
+        hits = get_metric_type.cache_info().hits
+        assert get_metric_type(TestData, "bytes_sent") == MetricType.COUNTER
+        assert get_metric_type.cache_info().hits == hits + 1
+
 
 class TestGetAllMetricTypes:
     """Tests for get_all_metric_types function."""
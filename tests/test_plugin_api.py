@@ -1,7 +1,6 @@
 """Tests for uptop plugin API."""
 
 from typing import Any
-from unittest.mock import MagicMock
 
 from pydantic import BaseModel
 import pytest
@@ -16,6 +15,8 @@ from uptop.plugin_api import (
     PluginBase,
 )
 
+_STUB_WIDGET = object()
+
 
 class TestAPIVersion:
     """Tests for API version."""
@@ -163,7 +164,7 @@ class TestPanePlugin:
                 return TestData(value=42.0, source="test")
 
             def render_tui(self, data: MetricData) -> Any:
-                return MagicMock()  # Mock widget
+                return _STUB_WIDGET
 
             def get_schema(self) -> type[BaseModel]:
                 return TestData
@@ -8,6 +8,9 @@ This module tests:
 - ProcessWidget messages for state changes
 """
 
+import dataclasses
+from dataclasses import dataclass
+import signal
 import time
 
 import pytest
@@ -28,6 +31,26 @@ from uptop.tui.screens import ConfirmKillScreen, FilterScreen, KillResult, KillS
 # ============================================================================
 
 
+# Sort/filter/tree tests only read process attributes, so the fixtures build
+# lightweight stand-ins instead of validated ProcessInfo models.
+@dataclass(slots=True, frozen=True)
+class _FakeProcessInfo:
+    """Slotted stand-in with the same attribute surface as ProcessInfo."""
+
+    pid: int
+    name: str
+    username: str
+    cpu_percent: float
+    memory_percent: float
+    memory_rss_bytes: int
+    memory_vms_bytes: int
+    status: str
+    create_time: float
+    cmdline: str | None
+    num_threads: int
+    source: str
+
+
 def create_sample_process(
     pid: int = 1234,
     name: str = "python",
@@ -37,8 +60,8 @@ def create_sample_process(
     status: str = "running",
     create_time: float | None = None,
     cmdline: str | None = "python test.py",
-) -> ProcessInfo:
-    """Create a sample ProcessInfo for testing.
+) -> _FakeProcessInfo:
+    """Create a sample process record for testing.
 
     Args:
         pid: Process ID
@@ -51,12 +74,12 @@ def create_sample_process(
         cmdline: Command line
 
     Returns:
-        ProcessInfo instance
+        _FakeProcessInfo with the same attributes as a ProcessInfo
     """
     if create_time is None:
         create_time = time.time() - 3600  # 1 hour ago
 
-    return ProcessInfo(
+    return _FakeProcessInfo(
         pid=pid,
         name=name,
         username=username,
@@ -72,42 +95,46 @@ def create_sample_process(
     )
 
 
+# Precomputed fixture strings for the sample process list (max count 16)
+_NAMES = tuple(f"process_{i}" for i in range(16))
+_USERS = ("user0", "user1")
+_CMDLINES = tuple(f"/usr/bin/process_{i} --arg{i}" for i in range(16))
+
+
 def create_sample_process_list(count: int = 5) -> ProcessListData:
     """Create a sample ProcessListData for testing.
 
     Args:
-        count: Number of processes to create
+        count: Number of processes to create (at most 16)
 
     Returns:
         ProcessListData instance
     """
-    processes = []
-    running_count = 0
-
-    for i in range(count):
-        status = "running" if i % 3 == 0 else "sleeping"
-        if status == "running":
-            running_count += 1
-
-        proc = create_sample_process(
+    processes = [
+        create_sample_process(
             pid=1000 + i,
-            name=f"process_{i}",
-            username=f"user{i % 2}",
+            name=_NAMES[i],
+            username=_USERS[i & 1],
             cpu_percent=float(i * 10),
             memory_percent=float(i * 5),
-            status=status,
-            cmdline=f"/usr/bin/process_{i} --arg{i}",
+            status="running" if i % 3 == 0 else "sleeping",
+            cmdline=_CMDLINES[i],
         )
-        processes.append(proc)
+        for i in range(count)
+    ]
 
-    return ProcessListData(
+    return ProcessListData.model_construct(
         processes=processes,
         total_count=count,
-        running_count=running_count,
+        running_count=sum(1 for i in range(count) if i % 3 == 0),
         source="test",
     )
 
 
+# Every process in the tree fixture uses the default "running" status
+_TREE_RUNNING_COUNT = 7
+
+
 def create_process_tree_list() -> ProcessListData:
     """Create a sample ProcessListData for tree view testing.
 
@@ -127,10 +154,10 @@ def create_process_tree_list() -> ProcessListData:
         create_sample_process(pid=302, name="nginx-worker", cpu_percent=8.0),
     ]
 
-    return ProcessListData(
+    return ProcessListData.model_construct(
         processes=processes,
         total_count=len(processes),
-        running_count=sum(1 for p in processes if p.status == "running"),
+        running_count=_TREE_RUNNING_COUNT,
         source="test",
     )
 
@@ -198,13 +225,11 @@ class TestSortCycling:
             sort_column=ProcessColumn.CPU,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             assert widget.sort_column == ProcessColumn.CPU
             widget.cycle_sort()
-            await pilot.pause()
 
             assert widget.sort_column == ProcessColumn.MEM
             assert widget.sort_direction == SortDirection.DESCENDING
@@ -217,13 +242,11 @@ class TestSortCycling:
             sort_column=ProcessColumn.COMMAND,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             assert widget.sort_column == ProcessColumn.COMMAND
             widget.cycle_sort()
-            await pilot.pause()
 
             assert widget.sort_column == ProcessColumn.CPU
 
@@ -235,14 +258,13 @@ class TestSortCycling:
             sort_column=ProcessColumn.CPU,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             # Full cycle through all columns
+            # cycle_sort mutates sort state synchronously, so no pause is needed
             for expected_col in SORT_CYCLE_ORDER[1:] + [SORT_CYCLE_ORDER[0]]:
                 widget.cycle_sort()
-                await pilot.pause()
                 assert widget.sort_column == expected_col
 
     @pytest.mark.asyncio
@@ -254,12 +276,10 @@ class TestSortCycling:
             sort_direction=SortDirection.ASCENDING,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.cycle_sort()
-            await pilot.pause()
 
             # Even though we started with ascending, cycle sets descending
             assert widget.sort_direction == SortDirection.DESCENDING
@@ -272,12 +292,10 @@ class TestSortCycling:
             sort_column=ProcessColumn.CPU,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.cycle_sort()
-            await pilot.pause()
 
             summary = widget.query_one("#summary-bar", Label)
             assert "MEM%" in summary.content
@@ -307,86 +325,47 @@ class TestSortChangedMessage:
 class TestFilterFunctionality:
     """Tests for filter functionality."""
 
-    @pytest.mark.asyncio
-    async def test_filter_by_name(self) -> None:
+    def test_filter_by_name(self) -> None:
         """Test filtering processes by name."""
         data = create_sample_process_list(5)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
+        filtered = ProcessWidget._apply_filter(data.processes, "process_0")
+        # Should filter to only process_0
+        assert len(filtered) == 1
 
-            widget.set_filter("process_0")
-            await pilot.pause()
-
-            table = widget.query_one("#process-table", DataTable)
-            # Should filter to only process_0
-            assert table.row_count == 1
-
-    @pytest.mark.asyncio
-    async def test_filter_by_pid(self) -> None:
+    def test_filter_by_pid(self) -> None:
         """Test filtering processes by PID."""
         data = create_sample_process_list(5)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
+        filtered = ProcessWidget._apply_filter(data.processes, "1002")
+        # Should filter to process with PID 1002
+        assert len(filtered) == 1
 
-            widget.set_filter("1002")
-            await pilot.pause()
-
-            table = widget.query_one("#process-table", DataTable)
-            # Should filter to process with PID 1002
-            assert table.row_count == 1
-
-    @pytest.mark.asyncio
-    async def test_filter_by_username(self) -> None:
+    def test_filter_by_username(self) -> None:
         """Test filtering processes by username."""
         data = create_sample_process_list(5)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-
-            widget.set_filter("user0")
-            await pilot.pause()
+        filtered = ProcessWidget._apply_filter(data.processes, "user0")
+        # Should filter to processes with user0 (indices 0, 2, 4)
+        assert len(filtered) == 3
 
-            table = widget.query_one("#process-table", DataTable)
-            # Should filter to processes with user0 (indices 0, 2, 4)
-            assert table.row_count == 3
-
-    @pytest.mark.asyncio
-    async def test_filter_case_insensitive(self) -> None:
+    def test_filter_case_insensitive(self) -> None:
         """Test that filtering is case insensitive."""
         data = create_sample_process_list(5)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-
-            widget.set_filter("PROCESS_0")
-            await pilot.pause()
-
-            table = widget.query_one("#process-table", DataTable)
-            # Should still match process_0
-            assert table.row_count == 1
+        filtered = ProcessWidget._apply_filter(data.processes, "PROCESS_0")
+        # Should still match process_0
+        assert len(filtered) == 1
 
     @pytest.mark.asyncio
     async def test_clear_filter(self) -> None:
         """Test clearing the filter."""
         data = create_sample_process_list(5)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.set_filter("process_0")
-            await pilot.pause()
             table = widget.query_one("#process-table", DataTable)
             assert table.row_count == 1
 
             widget.clear_filter()
-            await pilot.pause()
             assert table.row_count == 5
 
     @pytest.mark.asyncio
@@ -394,12 +373,10 @@ class TestFilterFunctionality:
         """Test that filter updates the summary bar."""
         data = create_sample_process_list(5)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.set_filter("process")
-            await pilot.pause()
 
             summary = widget.query_one("#summary-bar", Label)
             assert "Filter:" in summary.content
@@ -470,8 +447,6 @@ class TestKillSignal:
 
     def test_kill_signal_values(self) -> None:
         """Test KillSignal has correct signal values."""
-        import signal
-
         assert KillSignal.SIGTERM.value == signal.SIGTERM
         assert KillSignal.SIGKILL.value == signal.SIGKILL
 
@@ -504,8 +479,7 @@ class TestTreeViewToggle:
     async def test_tree_view_defaults_to_false(self) -> None:
         """Test that tree_view defaults to False."""
         app = ProcessWidgetTestApp()
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
             assert widget.tree_view is False
 
@@ -514,18 +488,15 @@ class TestTreeViewToggle:
         """Test toggling tree view on and off."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             # Toggle on
             widget.toggle_tree_view()
-            await pilot.pause()
             assert widget.tree_view is True
 
             # Toggle off
             widget.toggle_tree_view()
-            await pilot.pause()
             assert widget.tree_view is False
 
     @pytest.mark.asyncio
@@ -533,12 +504,10 @@ class TestTreeViewToggle:
         """Test that tree view updates the summary bar."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.toggle_tree_view()
-            await pilot.pause()
 
             summary = widget.query_one("#summary-bar", Label)
             assert "Tree View" in summary.content
@@ -548,12 +517,10 @@ class TestTreeViewToggle:
         """Test tree view displays parent-child relationships."""
         data = create_process_tree_list()
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             widget.toggle_tree_view()
-            await pilot.pause()
 
             table = widget.query_one("#process-table", DataTable)
             # All processes should still be visible
@@ -629,3 +596,47 @@ class TestProcessWidgetFilterMethods:
         widget.filter_text = "nonexistent"
         proc = create_sample_process(name="python", cmdline="test.py", username="user")
         assert widget._matches_filter(proc) is False
+
+    def test_apply_filter_empty_returns_all(self) -> None:
+        """Test _apply_filter keeps every process for an empty filter."""
+        data = create_sample_process_list(5)
+        assert ProcessWidget._apply_filter(data.processes, "") == data.processes
+
+    def test_filter_mask_matches_each_column(self) -> None:
+        """Test _filter_mask flags matches in name, cmdline, username and PID."""
+        processes = [
+            create_sample_process(pid=10, name="alpha", cmdline=None, username="root"),
+            create_sample_process(pid=11, name="beta", cmdline="/opt/Alpha", username="root"),
+            create_sample_process(pid=12, name="gamma", cmdline="gamma", username="ALPHA"),
+            create_sample_process(pid=13, name="delta", cmdline="delta", username="root"),
+        ]
+        assert ProcessWidget._filter_mask(processes, "alpha") == [True, True, True, False]
+        assert ProcessWidget._filter_mask(processes, "13") == [False, False, False, True]
+
+    def test_filter_mask_treats_filter_literally(self) -> None:
+        """Test regex metacharacters in the filter are matched literally."""
+        processes = [
+            create_sample_process(name="a.b", cmdline=None),
+            create_sample_process(name="axb", cmdline=None),
+        ]
+        assert ProcessWidget._filter_mask(processes, "a.b") == [True, False]
+
+    def test_filter_haystack_reused_for_same_data(self) -> None:
+        """Test the filter search text is only rebuilt for new process lists."""
+        widget = ProcessWidget()
+        processes = create_sample_process_list(3).processes
+        _, starts = widget._get_filter_haystack(processes)
+        assert widget._get_filter_haystack(processes)[1] is starts
+        assert widget._get_filter_haystack(list(processes))[1] is not starts
+
+
+class TestFakeProcessInfo:
+    """Tests that the fixture stand-in stays in step with ProcessInfo."""
+
+    def test_fake_matches_process_info(self) -> None:
+        """Test the stand-in mirrors every ProcessInfo field the widget can read."""
+        fake = create_sample_process()
+        real = ProcessInfo(**dataclasses.asdict(fake))
+        fake_fields = {field.name for field in dataclasses.fields(fake)}
+        assert fake_fields == set(ProcessInfo.model_fields) - {"timestamp"}
+        assert {name: getattr(real, name) for name in fake_fields} == dataclasses.asdict(fake)
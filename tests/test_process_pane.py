@@ -222,12 +222,12 @@ class TestProcessCollector:
             "memory_info": MockMemInfo(rss=1024 * 1024, vms=2048 * 1024),
             "status": "running",
             "create_time": 1704067200.0,
-            "cmdline": ["python", "test.py"],
             "num_threads": 2,
         }
 
         mock_proc = MagicMock()
         mock_proc.info = mock_proc_info
+        mock_proc.cmdline.return_value = ["python", "test.py"]
 
         with patch("psutil.process_iter") as mock_iter:
             mock_iter.return_value = [mock_proc]
@@ -335,12 +335,12 @@ class TestProcessCollector:
             "memory_info": MockMemInfo(rss=0, vms=0),
             "status": "sleeping",
             "create_time": 0.0,
-            "cmdline": [],
             "num_threads": 1,
         }
 
         mock_proc = MagicMock()
         mock_proc.info = mock_proc_info
+        mock_proc.cmdline.return_value = []
 
         with patch("psutil.process_iter", return_value=[mock_proc]):
             collector = ProcessCollector()
@@ -354,6 +354,7 @@ class TestProcessCollector:
         MockMemInfo = namedtuple("MockMemInfo", ["rss", "vms"])
 
         running_proc = MagicMock()
+        running_proc.cmdline.side_effect = psutil.AccessDenied(1)
         running_proc.info = {
             "pid": 1,
             "name": "running",
@@ -363,11 +364,11 @@ class TestProcessCollector:
             "memory_info": MockMemInfo(0, 0),
             "status": psutil.STATUS_RUNNING,
             "create_time": 0.0,
-            "cmdline": None,
             "num_threads": 1,
         }
 
         sleeping_proc = MagicMock()
+        sleeping_proc.cmdline.side_effect = psutil.AccessDenied(2)
         sleeping_proc.info = {
             "pid": 2,
             "name": "sleeping",
@@ -377,7 +378,6 @@ class TestProcessCollector:
             "memory_info": MockMemInfo(0, 0),
             "status": psutil.STATUS_SLEEPING,
             "create_time": 0.0,
-            "cmdline": None,
             "num_threads": 1,
         }
 
@@ -388,6 +388,95 @@ class TestProcessCollector:
         assert result.total_count == 2
         assert result.running_count == 1
 
+    @pytest.mark.asyncio
+    async def test_collect_clamps_out_of_range_values(self) -> None:
+        """Test that unvalidated collector output still respects model bounds."""
+        MockMemInfo = namedtuple("MockMemInfo", ["rss", "vms"])
+        mock_proc = MagicMock()
+        mock_proc.cmdline.side_effect = psutil.AccessDenied(1)
+        mock_proc.info = {
+            "pid": 1,
+            "name": "odd",
+            "username": "",
+            "cpu_percent": -1.0,
+            "memory_percent": 100.5,
+            "memory_info": MockMemInfo(rss=-1, vms=-1),
+            "status": "sleeping",
+            "create_time": 0.0,
+            "num_threads": 1,
+        }
+
+        with patch("psutil.process_iter", return_value=[mock_proc]):
+            collector = ProcessCollector()
+            result = await collector.collect()
+
+        proc = result.processes[0]
+        assert proc.cpu_percent == 0.0
+        assert proc.memory_percent == 100.0
+        assert proc.memory_rss_bytes == 0
+        assert proc.memory_vms_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_collect_strips_whitespace(self) -> None:
+        """Test that unvalidated collector strings are stripped like validated ones."""
+        mock_proc = MagicMock()
+        mock_proc.info = {
+            "pid": 1,
+            "name": "  worker ",
+            "username": " user\n",
+            "status": "sleeping",
+            "create_time": 0.0,
+        }
+        mock_proc.cmdline.return_value = ["python", "a.py", "", ""]
+
+        with patch("psutil.process_iter", return_value=[mock_proc]):
+            collector = ProcessCollector()
+            result = await collector.collect()
+
+        proc = result.processes[0]
+        assert proc.name == "worker"
+        assert proc.username == "user"
+        assert proc.cmdline == "python a.py"
+
+    @pytest.mark.asyncio
+    async def test_collect_caches_cmdline(self) -> None:
+        """Test that cmdline is read once per process and re-read after exec."""
+        mock_proc = MagicMock()
+        mock_proc.cmdline.return_value = ["python", "test.py"]
+        names = iter(["python", "python", "bash"])
+
+        def mock_iter(*args: Any, **kwargs: Any) -> list[MagicMock]:
+            mock_proc.info = {"pid": 1, "name": next(names), "create_time": 10.0}
+            return [mock_proc]
+
+        collector = ProcessCollector()
+        with patch("psutil.process_iter", mock_iter):
+            first = await collector.collect()
+            second = await collector.collect()
+
+            # Same PID and create time, but the process exec'd a new program
+            mock_proc.cmdline.return_value = ["bash"]
+            third = await collector.collect()
+
+        assert first.processes[0].cmdline == "python test.py"
+        assert second.processes[0].cmdline == "python test.py"
+        assert third.processes[0].cmdline == "bash"
+        assert mock_proc.cmdline.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_collect_cmdline_access_denied(self) -> None:
+        """Test that an unreadable cmdline results in None."""
+        mock_proc = MagicMock()
+        mock_proc.info = {"pid": 1, "name": "init", "create_time": 10.0}
+        mock_proc.cmdline.side_effect = psutil.AccessDenied(1)
+
+        with patch("psutil.process_iter", return_value=[mock_proc]):
+            collector = ProcessCollector()
+            result = await collector.collect()
+
+        assert result.total_count == 1
+        assert result.processes[0].cmdline is None
+
 
 # ============================================================================
 # ProcessPane Plugin Tests
@@ -9,12 +9,15 @@ This module tests the ProcessWidget functionality including:
 - Helper functions for formatting
 """
 
+from collections.abc import AsyncIterator
+from functools import cache
 import time
 
 import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import DataTable, Label
 
+from uptop.models.base import DisplayMode
 from uptop.plugins.processes import ProcessInfo, ProcessListData
 from uptop.tui.panes.process_widget import (
     COLUMN_CONFIG,
@@ -99,6 +102,11 @@ class TestFormatRuntime:
         result = format_runtime(many_hours)
         assert result == "100:30:15"
 
+    def test_format_runtime_explicit_now(self) -> None:
+        """Test that an explicit now snapshot is used instead of the clock."""
+        assert format_runtime(1000.0, now=1000.0 + 3661) == "01:01:01"
+        assert format_runtime(1000.0, now=500.0) == "00:00:00"
+
 
 class TestTruncateCommand:
     """Tests for truncate_command helper function."""
@@ -214,11 +222,56 @@ class TestProcessWidgetUnit:
         widget.set_filter("python")
         assert widget.filter_text == "python"
 
+    def test_get_sort_key_per_column(self) -> None:
+        """Test _get_sort_key reads the field for the current sort column."""
+        proc = create_sample_process(pid=42, username="Alice", cmdline=None, name="Bash")
+        widget = ProcessWidget(sort_column=ProcessColumn.PID)
+        assert widget._get_sort_key()(proc) == 42
+        widget.sort_column = ProcessColumn.MEM
+        assert widget._get_sort_key()(proc) == proc.memory_percent
+        widget.sort_column = ProcessColumn.USER
+        assert widget._get_sort_key()(proc) == "alice"
+        widget.sort_column = ProcessColumn.COMMAND
+        assert widget._get_sort_key()(proc) == "bash"
+
+    def test_set_sort_toggle_direction(self) -> None:
+        """Test that set_sort toggles direction on same column."""
+        widget = ProcessWidget(
+            sort_column=ProcessColumn.CPU,
+            sort_direction=SortDirection.DESCENDING,
+        )
+        widget.update_data(create_sample_process_list(3))
+
+        # Toggle CPU sort (should go from DESC to ASC)
+        widget.set_sort(ProcessColumn.CPU)
+
+        assert widget.sort_direction == SortDirection.ASCENDING
+
+    def test_micro_mode_uses_running_count(self) -> None:
+        """Test that MICRO mode shows the collector's running count."""
+        data = create_sample_process_list(6)
+        widget = ProcessWidget()
+        widget._display_mode = DisplayMode.MICRO
+        widget._data = data
+
+        (label,) = widget.compose()
+        assert isinstance(label, Label)
+        assert str(label.content) == f"Procs 6 ({data.running_count} run)"
+
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
+# Default creation time for sample processes (1 hour before the tests started)
+_FIXTURE_BASE_CREATE_TIME = time.time() - 3600
+
+# Sample process owners alternate between two users
+_USERNAMES = ("user0", "user1")
+
+# Every third sample process is running, the rest are sleeping
+_STATUS_CYCLE = ("running", "sleeping", "sleeping")
+
 
 def create_sample_process(
     pid: int = 1234,
@@ -239,16 +292,17 @@ def create_sample_process(
         cpu_percent: CPU usage percentage
         memory_percent: Memory usage percentage
         status: Process status
-        create_time: Creation timestamp (defaults to 1 hour ago)
+        create_time: Creation timestamp (defaults to 1 hour before the tests started)
         cmdline: Command line
 
     Returns:
         ProcessInfo instance
     """
     if create_time is None:
-        create_time = time.time() - 3600  # 1 hour ago
+        create_time = _FIXTURE_BASE_CREATE_TIME
 
-    return ProcessInfo(
+    # Values are known-valid, so skip pydantic validation
+    return ProcessInfo.model_construct(
         pid=pid,
         name=name,
         username=username,
@@ -267,35 +321,47 @@ def create_sample_process(
 def create_sample_process_list(count: int = 5) -> ProcessListData:
     """Create a sample ProcessListData for testing.
 
+    The processes are built once per count and shared; each call returns a
+    fresh ProcessListData with its own list, so tests may modify the result.
+    ProcessInfo rows are frozen and safe to share.
+
     Args:
         count: Number of processes to create
 
     Returns:
         ProcessListData instance
     """
-    processes = []
-    running_count = 0
+    data = _build_sample_process_list(count)
+    return data.model_copy(update={"processes": list(data.processes)})
+
 
-    for i in range(count):
-        status = "running" if i % 3 == 0 else "sleeping"
-        if status == "running":
-            running_count += 1
+@cache
+def _build_sample_process_list(count: int) -> ProcessListData:
+    """Build the shared ProcessListData behind create_sample_process_list.
+
+    Args:
+        count: Number of processes to create
 
-        proc = create_sample_process(
+    Returns:
+        ProcessListData instance (shared, do not modify)
+    """
+    processes = [
+        create_sample_process(
             pid=1000 + i,
             name=f"process_{i}",
-            username=f"user{i % 2}",
+            username=_USERNAMES[i & 1],
             cpu_percent=float(i * 10),
             memory_percent=float(i * 5),
-            status=status,
+            status=_STATUS_CYCLE[i % 3],
             cmdline=f"/usr/bin/process_{i} --arg{i}",
         )
-        processes.append(proc)
+        for i in range(count)
+    ]
 
     return ProcessListData(
         processes=processes,
         total_count=count,
-        running_count=running_count,
+        running_count=(count + 2) // 3,  # indices 0, 3, 6, ... are running
         source="test",
     )
 
@@ -305,6 +371,19 @@ def create_sample_process_list(count: int = 5) -> ProcessListData:
 # ============================================================================
 
 
+def assert_sorted_by(table: DataTable, column_index: int, *, ascending: bool) -> None:
+    """Assert that every row of a table is ordered by a numeric column.
+
+    Args:
+        table: DataTable to check
+        column_index: Index of the column holding numeric text
+        ascending: Whether values should increase down the table
+    """
+    values = [float(table.get_row_at(row)[column_index]) for row in range(table.row_count)]
+    assert values, "table has no rows"
+    assert values == sorted(values, reverse=not ascending)
+
+
 class ProcessWidgetTestApp(App[None]):
     """Test app for ProcessWidget testing."""
 
@@ -345,149 +424,134 @@ class ProcessWidgetTestApp(App[None]):
             widget.update_data(self._initial_data)
 
 
-class TestProcessWidgetRendering:
-    """Integration tests for ProcessWidget rendering using Textual pilot."""
+@pytest.fixture(scope="class")
+async def mounted_widget() -> AsyncIterator[ProcessWidget]:
+    """Mount one ProcessWidget with six sample processes for read-only tests.
 
-    @pytest.mark.asyncio
-    async def test_widget_composes_correctly(self) -> None:
-        """Test that ProcessWidget composes with DataTable and summary."""
-        app = ProcessWidgetTestApp()
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
+    Yields:
+        The mounted ProcessWidget, shared by every test in the class
+    """
+    app = ProcessWidgetTestApp(initial_data=create_sample_process_list(6))
+    async with app.run_test():
+        yield app.query_one("#test-process-widget", ProcessWidget)
 
-            # Should have a DataTable
-            table = widget.query_one("#process-table", DataTable)
-            assert table is not None
 
-            # Should have summary bar
-            summary = widget.query_one("#summary-bar")
-            assert summary is not None
+class TestProcessWidgetMounted:
+    """Read-only checks against a single mounted ProcessWidget."""
 
-    @pytest.mark.asyncio
-    async def test_columns_are_setup(self) -> None:
-        """Test that DataTable has all expected columns."""
-        app = ProcessWidgetTestApp()
-        async with app.run_test() as pilot:
-            # Wait for mount to complete
-            await pilot.pause()
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-            table = widget.query_one("#process-table", DataTable)
+    def test_widget_composes_correctly(self, mounted_widget: ProcessWidget) -> None:
+        """Test that ProcessWidget composes with DataTable and summary."""
+        assert mounted_widget.query_one("#process-table", DataTable) is not None
+        assert mounted_widget.query_one("#summary-bar") is not None
 
-            # Should have 9 columns
-            assert len(table.ordered_columns) == 9
+    def test_columns_are_setup(self, mounted_widget: ProcessWidget) -> None:
+        """Test that DataTable has all expected columns."""
+        table = mounted_widget.query_one("#process-table", DataTable)
+        assert len(table.ordered_columns) == 9
 
-    @pytest.mark.asyncio
-    async def test_update_data_populates_table(self) -> None:
+    def test_update_data_populates_table(self, mounted_widget: ProcessWidget) -> None:
         """Test that update_data populates the DataTable."""
-        data = create_sample_process_list(3)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-            table = widget.query_one("#process-table", DataTable)
-
-            # Should have 3 rows
-            assert table.row_count == 3
+        table = mounted_widget.query_one("#process-table", DataTable)
+        assert table.row_count == 6
 
-    @pytest.mark.asyncio
-    async def test_get_process_count_with_data(self) -> None:
+    def test_get_process_count_with_data(self, mounted_widget: ProcessWidget) -> None:
         """Test get_process_count returns correct count."""
-        data = create_sample_process_list(5)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-            assert widget.get_process_count() == 5
+        assert mounted_widget.get_process_count() == 6
 
-    @pytest.mark.asyncio
-    async def test_get_running_count_with_data(self) -> None:
+    def test_get_running_count_with_data(self, mounted_widget: ProcessWidget) -> None:
         """Test get_running_count returns correct count."""
-        data = create_sample_process_list(6)
-        app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-            # With our creation function, every 3rd process is running
-            # indices 0, 3 = 2 running out of 6
-            assert widget.get_running_count() == 2
+        # With our creation function, every 3rd process is running
+        # indices 0, 3 = 2 running out of 6
+        assert mounted_widget.get_running_count() == 2
+
+    def test_sorting_by_cpu(self, mounted_widget: ProcessWidget) -> None:
+        """Test that data is sorted by CPU descending by default."""
+        table = mounted_widget.query_one("#process-table", DataTable)
+        # The CPU column is index 2 (after PID and User); index 5 has 50.0
+        assert float(table.get_row_at(0)[2]) == 50.0
+        assert_sorted_by(table, 2, ascending=False)
+
+    def test_summary_bar_updates(self, mounted_widget: ProcessWidget) -> None:
+        """Test that summary bar shows correct information."""
+        summary = mounted_widget.query_one("#summary-bar", Label)
+        summary_text = summary.content
+        assert "Total: 6" in summary_text
+        assert "Running:" in summary_text
 
-    @pytest.mark.asyncio
-    async def test_sorting_by_cpu(self) -> None:
-        """Test that data is sorted by CPU by default."""
-        data = create_sample_process_list(3)
-        app = ProcessWidgetTestApp(
-            sort_column=ProcessColumn.CPU,
-            sort_direction=SortDirection.DESCENDING,
-            initial_data=data,
-        )
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            widget = app.query_one("#test-process-widget", ProcessWidget)
-            table = widget.query_one("#process-table", DataTable)
 
-            # First row should be highest CPU (index 2 has cpu_percent=20.0)
-            if table.row_count > 0:
-                first_row = table.get_row_at(0)
-                # The CPU column is index 2 (after PID and User)
-                assert float(first_row[2]) == 20.0
+class TestProcessWidgetRendering:
+    """Integration tests for ProcessWidget rendering using Textual pilot."""
 
     @pytest.mark.asyncio
     async def test_set_sort_changes_order(self) -> None:
         """Test that set_sort changes the sort order."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
 
             # Change to sort by PID ascending
             widget.set_sort(ProcessColumn.PID, SortDirection.ASCENDING)
-            await pilot.pause()
 
             table = widget.query_one("#process-table", DataTable)
-            if table.row_count > 0:
-                first_row = table.get_row_at(0)
-                # First row should be lowest PID (1000)
-                # Note: PID may be right-justified, so strip whitespace
-                assert first_row[0].strip() == "1000"
+            first_row = table.get_row_at(0)
+            # First row should be lowest PID (1000)
+            # Note: PID may be right-justified, so strip whitespace
+            assert first_row[0].strip() == "1000"
+            assert_sorted_by(table, 0, ascending=True)
 
     @pytest.mark.asyncio
-    async def test_set_sort_toggle_direction(self) -> None:
-        """Test that set_sort toggles direction on same column."""
+    async def test_update_data_updates_rows_in_place(self) -> None:
+        """Test that a refresh with the same row order keeps the existing rows."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(
-            sort_column=ProcessColumn.CPU,
-            sort_direction=SortDirection.DESCENDING,
+            sort_column=ProcessColumn.PID,
+            sort_direction=SortDirection.ASCENDING,
             initial_data=data,
         )
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
-
-            # Toggle CPU sort (should go from DESC to ASC)
-            widget.set_sort(ProcessColumn.CPU)
-            await pilot.pause()
-
-            assert widget.sort_direction == SortDirection.ASCENDING
+            table = widget.query_one("#process-table", DataTable)
+            first_key = widget._pid_to_row_key[1000]
+
+            updated = data.model_copy(
+                update={
+                    "processes": [
+                        *data.processes[:2],
+                        create_sample_process(pid=1002, cpu_percent=99.0),
+                        create_sample_process(pid=1003),
+                    ]
+                }
+            )
+            widget.update_data(updated)
+
+            # Surviving rows keep their original row keys (no rebuild)
+            assert widget._pid_to_row_key[1000] is first_key
+            assert table.row_count == 4
+            assert float(table.get_row_at(2)[2]) == 99.0
+            assert table.get_row_at(3)[0].strip() == "1003"
 
     @pytest.mark.asyncio
-    async def test_summary_bar_updates(self) -> None:
-        """Test that summary bar shows correct information."""
-        data = create_sample_process_list(5)
+    async def test_update_data_rebuilds_when_order_changes(self) -> None:
+        """Test that reordered rows are shown in the new sort order."""
+        data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            # Wait for mount and data update
-            await pilot.pause()
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
-            summary = widget.query_one("#summary-bar", Label)
+            table = widget.query_one("#process-table", DataTable)
+
+            updated = data.model_copy(
+                update={
+                    "processes": [
+                        create_sample_process(pid=1000, cpu_percent=80.0),
+                        *data.processes[1:],
+                    ]
+                }
+            )
+            widget.update_data(updated)
 
-            # Summary should contain count information
-            summary_text = summary.content
-            assert "Total: 5" in summary_text
-            assert "Running:" in summary_text
+            assert table.row_count == 3
+            assert table.get_row_at(0)[0].strip() == "1000"
 
 
 class TestProcessWidgetSelection:
@@ -497,8 +561,7 @@ class TestProcessWidgetSelection:
     async def test_get_selected_pid_no_data(self) -> None:
         """Test get_selected_pid returns None when no data."""
         app = ProcessWidgetTestApp()
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
             assert widget.get_selected_pid() is None
 
@@ -507,14 +570,12 @@ class TestProcessWidgetSelection:
         """Test get_selected_pid returns PID of selected row."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
             table = widget.query_one("#process-table", DataTable)
 
             # Select first row
             table.cursor_coordinate = (0, 0)
-            await pilot.pause()
 
             # Should return the PID of the first row
             pid = widget.get_selected_pid()
@@ -525,8 +586,7 @@ class TestProcessWidgetSelection:
     async def test_get_selected_process_no_data(self) -> None:
         """Test get_selected_process returns None when no data."""
         app = ProcessWidgetTestApp()
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
             assert widget.get_selected_process() is None
 
@@ -535,14 +595,12 @@ class TestProcessWidgetSelection:
         """Test get_selected_process returns ProcessInfo of selected row."""
         data = create_sample_process_list(3)
         app = ProcessWidgetTestApp(initial_data=data)
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        async with app.run_test():
             widget = app.query_one("#test-process-widget", ProcessWidget)
             table = widget.query_one("#process-table", DataTable)
 
             # Select first row
             table.cursor_coordinate = (0, 0)
-            await pilot.pause()
 
             process = widget.get_selected_process()
             assert process is not None
@@ -554,18 +612,18 @@ class TestProcessWidgetColumnConfig:
 
     def test_all_columns_have_config(self) -> None:
         """Test that all ProcessColumn values have config entries."""
-        for col in ProcessColumn:
-            assert col in COLUMN_CONFIG
-            config = COLUMN_CONFIG[col]
-            assert len(config) == 3  # (display_name, width, is_sortable)
+        assert COLUMN_CONFIG.keys() == set(ProcessColumn)
+        # (display_name, width, is_sortable)
+        assert all(len(config) == 3 for config in COLUMN_CONFIG.values())
 
     def test_column_config_types(self) -> None:
         """Test that config values have correct types."""
-        for _col, config in COLUMN_CONFIG.items():
-            display_name, width, is_sortable = config
-            assert isinstance(display_name, str)
-            assert width is None or isinstance(width, int)
-            assert isinstance(is_sortable, bool)
+        for col, config in COLUMN_CONFIG.items():
+            match config:
+                case (str(), int() | None, bool()):
+                    pass
+                case _:
+                    pytest.fail(f"Bad COLUMN_CONFIG entry for {col}: {config!r}")
 
     def test_command_column_has_flexible_width(self) -> None:
         """Test that command column has flexible width (None)."""
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import re
 from datetime import UTC, datetime
+from typing import Any
 
 import pytest
 
@@ -30,6 +31,130 @@ from uptop.plugins.disk import DiskData, DiskIOStats, PartitionInfo
 from uptop.plugins.memory import MemoryData, SwapMemory, VirtualMemory
 from uptop.plugins.network import NetworkData, NetworkInterfaceData
 
+# Fixed timestamp for inputs and formatter calls that need a stable value
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+# (formatted output, comment lines, metric lines)
+CPUOutputLines = tuple[str, list[str], list[str]]
+
+
+@pytest.fixture(scope="module")
+def formatter() -> PrometheusFormatter:
+    """Provide a default PrometheusFormatter shared by the tests in this module.
+
+    format() keeps no per-call state on the instance, so one instance can
+    serve every test that keeps the default configuration.
+    """
+    return PrometheusFormatter()
+
+
+@pytest.fixture(scope="module")
+def cpu_output_lines(formatter: PrometheusFormatter) -> CPUOutputLines:
+    """Format the one-core CPU sample once and share the output and its lines.
+
+    Args:
+        formatter: Shared formatter instance
+
+    Returns:
+        Tuple of (formatted output, comment lines, metric lines)
+    """
+    output = formatter.format({"panes": {"cpu": _CPU_ONE_CORE_SAMPLE}})
+    lines = output.splitlines()
+    comment_lines = [line for line in lines if line.startswith("#")]
+    metric_lines = [line for line in lines if not line.startswith("#")]
+    return output, comment_lines, metric_lines
+
+
+def _make_cpu_dict(**overrides: Any) -> dict[str, Any]:
+    """Build a CPU pane dict shaped like CPUData.model_dump() without validation.
+
+    Args:
+        **overrides: Field values replacing the defaults
+
+    Returns:
+        CPU pane data dictionary
+    """
+    data: dict[str, Any] = {
+        "timestamp": _FIXED_TS,
+        "source": "cpu",
+        "cores": [],
+        "load_avg_1min": 1.0,
+        "load_avg_5min": 1.0,
+        "load_avg_15min": 1.0,
+    }
+    data.update(overrides)
+    return data
+
+
+# Sample pane data shared by tests that only inspect metric names and format.
+# Pydantic models are built (and dumped) once at import instead of per test.
+_CPU_SAMPLE = CPUData(
+    source="cpu",
+    cores=[],
+    load_avg_1min=1.5,
+    load_avg_5min=2.0,
+    load_avg_15min=1.8,
+).model_dump()
+
+_CPU_ONE_CORE_SAMPLE = CPUData(
+    source="cpu",
+    cores=[CPUCore(id=0, usage_percent=50.0, freq_mhz=3000.0, temp_celsius=None)],
+    load_avg_1min=1.0,
+    load_avg_5min=1.0,
+    load_avg_15min=1.0,
+).model_dump()
+
+_MEMORY_DATA = MemoryData(
+    source="memory",
+    virtual=VirtualMemory(
+        total_bytes=16000000000,
+        used_bytes=8000000000,
+        available_bytes=8000000000,
+        percent=50.0,
+        cached_bytes=None,
+        buffers_bytes=None,
+    ),
+    swap=SwapMemory(
+        total_bytes=4000000000,
+        used_bytes=1000000000,
+        free_bytes=3000000000,
+        percent=25.0,
+    ),
+)
+_MEMORY_SAMPLE = _MEMORY_DATA.model_dump()
+
+# Prometheus exposition format patterns used by the compliance tests
+_METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LEADING_NAME_RE = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+_METRIC_LINE_RE = re.compile(
+    r"^[a-zA-Z_:][a-zA-Z0-9_:]*(\{[^}]+\})?\s+-?[0-9]+\.?[0-9]*([eE][+-]?[0-9]+)?(\s+[0-9]+)?$"
+)
+
+_NETWORK_DATA = NetworkData(
+    source="network",
+    interfaces=[
+        NetworkInterfaceData(
+            name="eth0",
+            bytes_sent=1000000,
+            bytes_recv=2000000,
+            packets_sent=1000,
+            packets_recv=2000,
+            errors_in=0,
+            errors_out=0,
+            drops_in=0,
+            drops_out=0,
+            bandwidth_up=100.0,
+            bandwidth_down=200.0,
+            is_up=True,
+        ),
+    ],
+    connections=[],
+    total_bytes_sent=1000000,
+    total_bytes_recv=2000000,
+    total_bandwidth_up=100.0,
+    total_bandwidth_down=200.0,
+)
+
 
 class TestPrometheusFormatterBasics:
     """Test basic formatter properties and initialization."""
@@ -79,23 +204,13 @@ class TestMetricNaming:
         assert _sanitize_metric_name("metric:name") == "metric:name"
         assert _sanitize_metric_name("namespace:metric") == "namespace:metric"
 
-    def test_metric_prefix(self) -> None:
+    def test_metric_prefix(self, formatter: PrometheusFormatter) -> None:
         """Test that metrics are prefixed with uptop_."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[],
-            load_avg_1min=1.5,
-            load_avg_5min=2.0,
-            load_avg_15min=1.8,
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output = formatter.format({"panes": {"cpu": _CPU_SAMPLE}})
 
         # All metric names should start with uptop_
-        for line in output.split("\n"):
-            if line and not line.startswith("#"):
+        for line in output.splitlines():
+            if not line.startswith("#"):
                 assert line.startswith("uptop_"), f"Metric not prefixed: {line}"
 
 
@@ -112,6 +227,10 @@ class TestLabelFormatting:
         result = _format_labels({"core": "0"})
         assert result == '{core="0"}'
 
+    def test_format_labels_single_escaped(self) -> None:
+        """Test that a single label value is escaped like multiple labels."""
+        assert _format_labels({"path": 'C:\\"x"'}) == r'{path="C:\\\"x\""}'
+
     def test_format_labels_multiple(self) -> None:
         """Test formatting multiple labels."""
         result = _format_labels({"core": "0", "type": "physical"})
@@ -132,10 +251,14 @@ class TestLabelFormatting:
         # Test newline escaping
         assert _sanitize_label_value("line1\nline2") == r"line1\nline2"
 
-    def test_cpu_core_labels(self) -> None:
-        """Test that CPU cores get proper labels."""
-        formatter = PrometheusFormatter()
+        # Escapes are applied in one pass, so inserted backslashes are not re-escaped
+        assert _sanitize_label_value('a\\"b\n') == r'a\\\"b\n'
+
+        # Values without special characters are returned unchanged
+        assert _sanitize_label_value("eth0") == "eth0"
 
+    def test_cpu_core_labels(self, formatter: PrometheusFormatter) -> None:
+        """Test that CPU cores get proper labels."""
         cpu_data = CPUData(
             source="cpu",
             cores=[
@@ -153,10 +276,8 @@ class TestLabelFormatting:
         assert '{id="0"}' in output
         assert '{id="1"}' in output
 
-    def test_network_interface_labels(self) -> None:
+    def test_network_interface_labels(self, formatter: PrometheusFormatter) -> None:
         """Test that network interfaces get proper labels."""
-        formatter = PrometheusFormatter()
-
         network_data = NetworkData(
             source="network",
             interfaces=[
@@ -203,6 +324,14 @@ class TestLabelFormatting:
         assert '{id="eth0"}' in output
         assert '{id="lo"}' in output
 
+    def test_list_item_labels_include_host(self, formatter: PrometheusFormatter) -> None:
+        """Test that list item labels combine the host label with the item id."""
+        data = {"panes": {"cpu": _CPU_ONE_CORE_SAMPLE}, "hostname": "web1"}
+        output = formatter.format(data)
+
+        assert 'uptop_cpu_cores_usage_percent{host="web1",id="0"} 50.0' in output
+        assert 'uptop_cpu_cores_freq_mhz{host="web1",id="0"} 3000.0' in output
+
 
 class TestMetricTypes:
     """Test correct detection and output of metric types (counter vs gauge)."""
@@ -236,36 +365,9 @@ class TestMetricTypes:
         assert get_metric_type(PartitionInfo, "used_bytes") == MetricType.GAUGE
         assert get_metric_type(PartitionInfo, "percent") == MetricType.GAUGE
 
-    def test_type_comments_in_output(self) -> None:
+    def test_type_comments_in_output(self, formatter: PrometheusFormatter) -> None:
         """Test that TYPE comments are generated for scalar metrics with known types."""
-        formatter = PrometheusFormatter()
-
-        network_data = NetworkData(
-            source="network",
-            interfaces=[
-                NetworkInterfaceData(
-                    name="eth0",
-                    bytes_sent=1000000,
-                    bytes_recv=2000000,
-                    packets_sent=1000,
-                    packets_recv=2000,
-                    errors_in=0,
-                    errors_out=0,
-                    drops_in=0,
-                    drops_out=0,
-                    bandwidth_up=100.0,
-                    bandwidth_down=200.0,
-                    is_up=True,
-                ),
-            ],
-            connections=[],
-            total_bytes_sent=1000000,
-            total_bytes_recv=2000000,
-            total_bandwidth_up=100.0,
-            total_bandwidth_down=200.0,
-        )
-
-        output = formatter.format({"panes": {"network": network_data}})
+        output = formatter.format({"panes": {"network": _NETWORK_DATA}})
 
         # TYPE comments are only generated for scalar metrics at pane level
         # (not for list items - those don't get HELP/TYPE comments in _format_list)
@@ -277,25 +379,37 @@ class TestMetricTypes:
         assert "# TYPE uptop_network_total_bytes_sent counter" in output
         assert "# TYPE uptop_network_total_bytes_recv counter" in output
 
+    def test_cached_headers_follow_configuration(self) -> None:
+        """Test that cached HELP/TYPE lines follow the current configuration."""
+        formatter = PrometheusFormatter()
+        data = {
+            "panes": {"network": _NETWORK_DATA},
+            "timestamp": _FIXED_TS,
+        }
+
+        first = formatter.format(data)
+        assert "# HELP uptop_network_total_bandwidth_up" in first
+        assert formatter.format(data) == first
+
+        formatter.initialize({"include_help": False})
+        output = formatter.format(data)
+        assert "# HELP" not in output
+        assert "# TYPE uptop_network_total_bandwidth_up gauge" in output
+
 
 class TestCPUDataFormatting:
     """Test formatting of CPU data."""
 
-    def test_cpu_data_basic(self) -> None:
+    def test_cpu_data_basic(self, formatter: PrometheusFormatter) -> None:
         """Test basic CPU data formatting."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[
-                CPUCore(id=0, usage_percent=45.2, freq_mhz=3200.0, temp_celsius=65.5),
-            ],
+        cpu_data = _make_cpu_dict(
+            cores=[{"id": 0, "usage_percent": 45.2, "freq_mhz": 3200.0, "temp_celsius": 65.5}],
             load_avg_1min=1.5,
             load_avg_5min=2.0,
             load_avg_15min=1.8,
         )
 
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output = formatter.format({"panes": {"cpu": cpu_data}})
 
         # Check load averages
         assert "uptop_cpu_load_avg_1min" in output
@@ -305,23 +419,17 @@ class TestCPUDataFormatting:
         assert 'uptop_cpu_cores_usage_percent{id="0"} 45.2' in output
         assert 'uptop_cpu_cores_freq_mhz{id="0"} 3200' in output
 
-    def test_cpu_multiple_cores(self) -> None:
+    def test_cpu_multiple_cores(self, formatter: PrometheusFormatter) -> None:
         """Test CPU data with multiple cores."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
+        cpu_data = _make_cpu_dict(
             cores=[
-                CPUCore(id=0, usage_percent=45.2, freq_mhz=3200.0, temp_celsius=None),
-                CPUCore(id=1, usage_percent=38.7, freq_mhz=3100.0, temp_celsius=None),
-                CPUCore(id=2, usage_percent=52.1, freq_mhz=3300.0, temp_celsius=None),
+                {"id": 0, "usage_percent": 45.2, "freq_mhz": 3200.0, "temp_celsius": None},
+                {"id": 1, "usage_percent": 38.7, "freq_mhz": 3100.0, "temp_celsius": None},
+                {"id": 2, "usage_percent": 52.1, "freq_mhz": 3300.0, "temp_celsius": None},
             ],
-            load_avg_1min=1.5,
-            load_avg_5min=2.0,
-            load_avg_15min=1.8,
         )
 
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output = formatter.format({"panes": {"cpu": cpu_data}})
 
         # Check all cores have metrics (implementation uses "id" label)
         assert 'id="0"' in output
@@ -335,10 +443,8 @@ class TestCPUDataFormatting:
 class TestMemoryDataFormatting:
     """Test formatting of memory data."""
 
-    def test_memory_data_basic(self) -> None:
+    def test_memory_data_basic(self, formatter: PrometheusFormatter) -> None:
         """Test basic memory data formatting."""
-        formatter = PrometheusFormatter()
-
         memory_data = MemoryData(
             source="memory",
             virtual=VirtualMemory(
@@ -370,44 +476,30 @@ class TestMemoryDataFormatting:
         assert "uptop_memory_swap_percent" in output
         assert "25.0" in output
 
-    def test_memory_type_gauge(self) -> None:
+    def test_memory_type_gauge(self, formatter: PrometheusFormatter) -> None:
         """Test that memory metrics are typed as gauges."""
-        formatter = PrometheusFormatter()
+        output = formatter.format({"panes": {"memory": _MEMORY_DATA}})
 
-        memory_data = MemoryData(
-            source="memory",
-            virtual=VirtualMemory(
-                total_bytes=17179869184,
-                used_bytes=8589934592,
-                available_bytes=8589934592,
-                percent=50.0,
-                cached_bytes=None,
-                buffers_bytes=None,
-            ),
-            swap=SwapMemory(
-                total_bytes=4294967296,
-                used_bytes=1073741824,
-                free_bytes=3221225472,
-                percent=25.0,
-            ),
-        )
-
-        output = formatter.format({"panes": {"memory": memory_data}})
-
-        # Memory metrics should be gauges (TYPE is only added for scalar metrics with schema)
-        # The nested dicts don't have schema info, so no TYPE comments for them
-        # Just check the output contains the expected metrics
+        # Nested models are walked in place, so their schema types are emitted
         assert "uptop_memory_virtual_total_bytes" in output
         assert "uptop_memory_swap_percent" in output
+        assert "# TYPE uptop_memory_virtual_percent gauge" in output
+        assert "# TYPE uptop_memory_swap_percent gauge" in output
+
+    def test_model_and_dump_emit_same_samples(self, formatter: PrometheusFormatter) -> None:
+        """Test that a model and its model_dump() produce the same sample lines."""
+        def samples(pane: object) -> list[str]:
+            output = formatter.format({"panes": {"memory": pane}, "timestamp": _FIXED_TS})
+            return [line for line in output.splitlines() if not line.startswith("#")]
+
+        assert samples(_MEMORY_DATA) == samples(_MEMORY_SAMPLE)
 
 
 class TestNetworkDataFormatting:
     """Test formatting of network data."""
 
-    def test_network_data_basic(self) -> None:
+    def test_network_data_basic(self, formatter: PrometheusFormatter) -> None:
         """Test basic network data formatting."""
-        formatter = PrometheusFormatter()
-
         network_data = NetworkData(
             source="network",
             interfaces=[
@@ -442,36 +534,9 @@ class TestNetworkDataFormatting:
         # Check gauge metrics
         assert 'uptop_network_interfaces_bandwidth_up{id="eth0"} 1024.5' in output
 
-    def test_network_counters_typed_correctly(self) -> None:
+    def test_network_counters_typed_correctly(self, formatter: PrometheusFormatter) -> None:
         """Test that network counters have correct TYPE comments."""
-        formatter = PrometheusFormatter()
-
-        network_data = NetworkData(
-            source="network",
-            interfaces=[
-                NetworkInterfaceData(
-                    name="eth0",
-                    bytes_sent=1000000,
-                    bytes_recv=2000000,
-                    packets_sent=1000,
-                    packets_recv=2000,
-                    errors_in=0,
-                    errors_out=0,
-                    drops_in=0,
-                    drops_out=0,
-                    bandwidth_up=100.0,
-                    bandwidth_down=200.0,
-                    is_up=True,
-                ),
-            ],
-            connections=[],
-            total_bytes_sent=1000000,
-            total_bytes_recv=2000000,
-            total_bandwidth_up=100.0,
-            total_bandwidth_down=200.0,
-        )
-
-        output = formatter.format({"panes": {"network": network_data}})
+        output = formatter.format({"panes": {"network": _NETWORK_DATA}})
 
         # TYPE comments are only generated for scalar metrics with schema
         # Totals should have counter type
@@ -482,10 +547,8 @@ class TestNetworkDataFormatting:
 class TestDiskDataFormatting:
     """Test formatting of disk data."""
 
-    def test_disk_partition_data(self) -> None:
+    def test_disk_partition_data(self, formatter: PrometheusFormatter) -> None:
         """Test disk partition data formatting."""
-        formatter = PrometheusFormatter()
-
         disk_data = DiskData(
             source="disk",
             partitions=[
@@ -512,10 +575,8 @@ class TestDiskDataFormatting:
         assert "uptop_disk_partitions_percent" in output
         assert "40.0" in output
 
-    def test_disk_io_counters(self) -> None:
+    def test_disk_io_counters(self, formatter: PrometheusFormatter) -> None:
         """Test disk I/O counter formatting."""
-        formatter = PrometheusFormatter()
-
         disk_data = DiskData(
             source="disk",
             partitions=[],
@@ -545,95 +606,36 @@ class TestDiskDataFormatting:
 class TestPrometheusFormatCompliance:
     """Test compliance with Prometheus exposition format specification."""
 
-    def test_metric_name_pattern(self) -> None:
+    def test_metric_name_pattern(self, cpu_output_lines: CPUOutputLines) -> None:
         """Test that metric names match Prometheus pattern."""
-        formatter = PrometheusFormatter()
-        pattern = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+        _, _, metric_lines = cpu_output_lines
 
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[CPUCore(id=0, usage_percent=50.0, freq_mhz=None, temp_celsius=None)],
-            load_avg_1min=1.0,
-            load_avg_5min=1.0,
-            load_avg_15min=1.0,
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        for line in metric_lines:
+            # Extract metric name (before labels or space)
+            match = _LEADING_NAME_RE.match(line)
+            assert match, f"Invalid metric line: {line}"
+            metric_name = match.group(0)
+            assert _METRIC_NAME_RE.match(metric_name), f"Invalid metric name: {metric_name}"
 
-        for line in output.split("\n"):
-            if line and not line.startswith("#"):
-                # Extract metric name (before labels or space)
-                match = re.match(r"([a-zA-Z_:][a-zA-Z0-9_:]*)", line)
-                assert match, f"Invalid metric line: {line}"
-                metric_name = match.group(1)
-                assert pattern.match(metric_name), f"Invalid metric name: {metric_name}"
-
-    def test_help_comment_format(self) -> None:
+    def test_help_comment_format(self, formatter: PrometheusFormatter) -> None:
         """Test that HELP comments are properly formatted."""
-        formatter = PrometheusFormatter()
-
-        memory_data = MemoryData(
-            source="memory",
-            virtual=VirtualMemory(
-                total_bytes=16000000000,
-                used_bytes=8000000000,
-                available_bytes=8000000000,
-                percent=50.0,
-                cached_bytes=None,
-                buffers_bytes=None,
-            ),
-            swap=SwapMemory(
-                total_bytes=4000000000,
-                used_bytes=1000000000,
-                free_bytes=3000000000,
-                percent=25.0,
-            ),
-        )
-
-        output = formatter.format({"panes": {"memory": memory_data.model_dump()}})
+        output = formatter.format({"panes": {"memory": _MEMORY_SAMPLE}})
 
         # HELP comments should follow format: # HELP metric_name description
-        for line in output.split("\n"):
+        for line in output.splitlines():
             if line.startswith("# HELP"):
                 parts = line.split(" ", 3)
                 assert len(parts) >= 3, f"Malformed HELP line: {line}"
                 assert parts[0] == "#"
                 assert parts[1] == "HELP"
 
-    def test_type_comment_format(self) -> None:
+    def test_type_comment_format(self, formatter: PrometheusFormatter) -> None:
         """Test that TYPE comments are properly formatted."""
-        formatter = PrometheusFormatter()
-
-        network_data = NetworkData(
-            source="network",
-            interfaces=[
-                NetworkInterfaceData(
-                    name="eth0",
-                    bytes_sent=1000,
-                    bytes_recv=2000,
-                    packets_sent=10,
-                    packets_recv=20,
-                    errors_in=0,
-                    errors_out=0,
-                    drops_in=0,
-                    drops_out=0,
-                    bandwidth_up=100.0,
-                    bandwidth_down=200.0,
-                    is_up=True,
-                ),
-            ],
-            connections=[],
-            total_bytes_sent=1000,
-            total_bytes_recv=2000,
-            total_bandwidth_up=100.0,
-            total_bandwidth_down=200.0,
-        )
-
-        output = formatter.format({"panes": {"network": network_data}})
+        output = formatter.format({"panes": {"network": _NETWORK_DATA}})
 
         # TYPE comments should follow format: # TYPE metric_name type
         valid_types = {"counter", "gauge", "histogram", "summary", "untyped"}
-        for line in output.split("\n"):
+        for line in output.splitlines():
             if line.startswith("# TYPE"):
                 parts = line.split()
                 assert len(parts) == 4, f"Malformed TYPE line: {line}"
@@ -641,63 +643,33 @@ class TestPrometheusFormatCompliance:
                 assert parts[1] == "TYPE"
                 assert parts[3] in valid_types, f"Invalid type: {parts[3]}"
 
-    def test_metric_line_format(self) -> None:
+    def test_metric_line_format(self, cpu_output_lines: CPUOutputLines) -> None:
         """Test that metric lines follow format: name{labels} value [timestamp]."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[CPUCore(id=0, usage_percent=50.0, freq_mhz=3000.0, temp_celsius=None)],
-            load_avg_1min=1.0,
-            load_avg_5min=1.0,
-            load_avg_15min=1.0,
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        _, _, metric_lines = cpu_output_lines
 
         # Metric lines should match: metric_name{labels} value [timestamp_ms]
         # The timestamp is optional in Prometheus format
-        metric_pattern = re.compile(
-            r"^[a-zA-Z_:][a-zA-Z0-9_:]*(\{[^}]+\})?\s+-?[0-9]+\.?[0-9]*([eE][+-]?[0-9]+)?(\s+[0-9]+)?$"
-        )
-
-        for line in output.split("\n"):
-            if line and not line.startswith("#"):
-                assert metric_pattern.match(line), f"Invalid metric line format: {line}"
+        for line in metric_lines:
+            assert _METRIC_LINE_RE.match(line), f"Invalid metric line format: {line}"
 
-    def test_no_empty_metric_values(self) -> None:
+    def test_no_empty_metric_values(self, cpu_output_lines: CPUOutputLines) -> None:
         """Test that None values are not emitted as metrics."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[
-                CPUCore(id=0, usage_percent=50.0, freq_mhz=None, temp_celsius=None),
-            ],
-            load_avg_1min=1.0,
-            load_avg_5min=1.0,
-            load_avg_15min=1.0,
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output, _, metric_lines = cpu_output_lines
 
         # Should not have metrics with "None" as value
         assert "None" not in output
 
         # Should not have metrics with empty value
-        for line in output.split("\n"):
-            if line and not line.startswith("#"):
-                parts = line.split()
-                assert len(parts) >= 2, f"Metric line missing value: {line}"
+        for line in metric_lines:
+            parts = line.split()
+            assert len(parts) >= 2, f"Metric line missing value: {line}"
 
 
 class TestBooleanHandling:
     """Test handling of boolean values."""
 
-    def test_boolean_values_skipped(self) -> None:
+    def test_boolean_values_skipped(self, formatter: PrometheusFormatter) -> None:
         """Test that boolean values are skipped (not emitted as metrics)."""
-        formatter = PrometheusFormatter()
-
         network_data = NetworkData(
             source="network",
             interfaces=[
@@ -733,35 +705,27 @@ class TestBooleanHandling:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_empty_data(self) -> None:
+    def test_empty_data(self, formatter: PrometheusFormatter) -> None:
         """Test formatting empty data."""
-        formatter = PrometheusFormatter()
-
         output = formatter.format({})
         assert output == ""
 
-    def test_empty_pane_data(self) -> None:
+    def test_empty_pane_data(self, formatter: PrometheusFormatter) -> None:
         """Test formatting with empty pane data."""
-        formatter = PrometheusFormatter()
-
         output = formatter.format({"panes": {"cpu": {}}})
         # Should produce no output for empty pane
         assert output.strip() == ""
 
-    def test_non_dict_pane_data_skipped(self) -> None:
+    def test_non_dict_pane_data_skipped(self, formatter: PrometheusFormatter) -> None:
         """Test that non-dict pane data is skipped."""
-        formatter = PrometheusFormatter()
-
         output = formatter.format({"panes": {"cpu": "invalid", "memory": None, "disk": 123}})
         # Should produce no output for invalid data
         assert output.strip() == ""
 
-    def test_special_float_values(self) -> None:
+    def test_special_float_values(self, formatter: PrometheusFormatter) -> None:
         """Test handling of special float values (NaN, Inf)."""
         import math
 
-        formatter = PrometheusFormatter()
-
         # Create a dict directly with special float values
         # (bypassing Pydantic validation which doesn't allow NaN/Inf)
         data = {
@@ -776,43 +740,14 @@ class TestEdgeCases:
 
         output = formatter.format(data)
 
-        # Check that special values are formatted correctly
-        # NaN, +Inf, -Inf are valid Prometheus values
-        assert "nan" in output.lower()
-        assert "inf" in output.lower()
+        # Check that special values use the Prometheus spellings
+        assert "uptop_test_nan_value NaN" in output
+        assert "uptop_test_inf_value +Inf" in output
+        assert "uptop_test_neg_inf_value -Inf" in output
 
-    def test_multiple_panes(self) -> None:
+    def test_multiple_panes(self, formatter: PrometheusFormatter) -> None:
         """Test formatting multiple panes together."""
-        formatter = PrometheusFormatter()
-
-        data = {
-            "panes": {
-                "cpu": CPUData(
-                    source="cpu",
-                    cores=[],
-                    load_avg_1min=1.0,
-                    load_avg_5min=1.0,
-                    load_avg_15min=1.0,
-                ).model_dump(),
-                "memory": MemoryData(
-                    source="memory",
-                    virtual=VirtualMemory(
-                        total_bytes=16000000000,
-                        used_bytes=8000000000,
-                        available_bytes=8000000000,
-                        percent=50.0,
-                        cached_bytes=None,
-                        buffers_bytes=None,
-                    ),
-                    swap=SwapMemory(
-                        total_bytes=4000000000,
-                        used_bytes=1000000000,
-                        free_bytes=3000000000,
-                        percent=25.0,
-                    ),
-                ).model_dump(),
-            }
-        }
+        data = {"panes": {"cpu": _CPU_SAMPLE, "memory": _MEMORY_SAMPLE}}
 
         output = formatter.format(data)
 
@@ -820,37 +755,16 @@ class TestEdgeCases:
         assert "uptop_cpu" in output
         assert "uptop_memory" in output
 
-    def test_timestamp_skipped(self) -> None:
+    def test_timestamp_skipped(self, formatter: PrometheusFormatter) -> None:
         """Test that timestamp field is not emitted as a metric."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[],
-            load_avg_1min=1.0,
-            load_avg_5min=1.0,
-            load_avg_15min=1.0,
-            timestamp=datetime.now(UTC),
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output = formatter.format({"panes": {"cpu": _make_cpu_dict(timestamp=_FIXED_TS)}})
 
         # timestamp should not appear as a metric
         assert "uptop_cpu_timestamp" not in output
 
-    def test_source_field_skipped(self) -> None:
+    def test_source_field_skipped(self, formatter: PrometheusFormatter) -> None:
         """Test that source field is not emitted as a metric."""
-        formatter = PrometheusFormatter()
-
-        cpu_data = CPUData(
-            source="cpu",
-            cores=[],
-            load_avg_1min=1.0,
-            load_avg_5min=1.0,
-            load_avg_15min=1.0,
-        )
-
-        output = formatter.format({"panes": {"cpu": cpu_data.model_dump()}})
+        output = formatter.format({"panes": {"cpu": _CPU_SAMPLE}})
 
         # source should not appear as a metric
         assert "uptop_cpu_source" not in output
@@ -1,8 +1,8 @@
 """Tests for uptop plugin registry."""
 
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock
+import py_compile
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 import pytest
@@ -20,6 +20,114 @@ from uptop.plugins.registry import (
     PluginValidationError,
 )
 
+# Returned by the test panes' render_tui; no test inspects the widget
+_RENDER_SENTINEL = object()
+
+# Resolved once; the registry fixture passes it instead of re-deriving it per test
+_DEFAULT_PLUGIN_DIR = Path.home() / ".uptop" / "plugins"
+
+
+@pytest.fixture
+def registry() -> PluginRegistry:
+    """Provide an empty registry using the default plugin directory."""
+    return PluginRegistry(plugin_dir=_DEFAULT_PLUGIN_DIR)
+
+
+def _make_two_pane_registry() -> PluginRegistry:
+    """Build a registry with SamplePanePlugin and AnotherPanePlugin registered."""
+    registry = PluginRegistry(plugin_dir=_DEFAULT_PLUGIN_DIR)
+    registry.register(SamplePanePlugin())
+    registry.register(AnotherPanePlugin())
+    return registry
+
+
+@pytest.fixture
+def two_pane_registry() -> PluginRegistry:
+    """Provide a fresh two-pane registry for tests that change it."""
+    return _make_two_pane_registry()
+
+
+@pytest.fixture(scope="module")
+def shared_two_pane_registry() -> PluginRegistry:
+    """Provide one two-pane registry for tests that only read it."""
+    return _make_two_pane_registry()
+
+
+_FILE_PLUGIN_CODE = """from typing import Any
+from pydantic import BaseModel
+from uptop.models import MetricData
+from uptop.plugin_api import PanePlugin
+
+
+class TestData(MetricData):
+    test_value: str = "test"
+
+
+class DirectoryTestPlugin(PanePlugin):
+    name = "directory_test"
+    display_name = "Directory Test Plugin"
+
+    async def collect_data(self) -> TestData:
+        return TestData(source="test")
+
+    def render_tui(self, data: MetricData) -> Any:
+        return None
+
+    def get_schema(self) -> type[BaseModel]:
+        return TestData
+"""
+
+_PACKAGE_PLUGIN_CODE = """from typing import Any
+from pydantic import BaseModel
+from uptop.models import MetricData
+from uptop.plugin_api import PanePlugin
+
+
+class PackageData(MetricData):
+    pkg_value: str = "pkg"
+
+
+class PackagePlugin(PanePlugin):
+    name = "package_plugin"
+    display_name = "Package Plugin"
+
+    async def collect_data(self) -> PackageData:
+        return PackageData(source="package")
+
+    def render_tui(self, data: MetricData) -> Any:
+        return None
+
+    def get_schema(self) -> type[BaseModel]:
+        return PackageData
+"""
+
+_INVALID_PLUGIN_CODE = "this is not valid python {{{"
+
+
+@pytest.fixture(scope="module")
+def prebuilt_plugin_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the valid test plugins once and precompile them.
+
+    Discovery tests only read this directory, so they share it instead of
+    rewriting the plugin sources into a fresh tmp_path each time.
+    """
+    plugin_dir = tmp_path_factory.mktemp("plugins")
+
+    plugin_file = plugin_dir / "test_plugin.py"
+    plugin_file.write_text(_FILE_PLUGIN_CODE)
+
+    package_dir = plugin_dir / "my_plugin"
+    package_dir.mkdir()
+    init_file = package_dir / "__init__.py"
+    init_file.write_text(_PACKAGE_PLUGIN_CODE)
+
+    (plugin_dir / "_private_plugin.py").write_text("# This should be skipped")
+
+    for source in (plugin_file, init_file):
+        py_compile.compile(str(source), doraise=True)
+
+    return plugin_dir
+
 
 class SampleData(MetricData):
     """Sample data model for testing."""
@@ -38,7 +146,7 @@ class SamplePanePlugin(PanePlugin):
         return SampleData(value=42, source="sample")
 
     def render_tui(self, data: MetricData) -> Any:
-        return MagicMock()
+        return _RENDER_SENTINEL
 
     def get_schema(self) -> type[BaseModel]:
         return SampleData
@@ -54,7 +162,7 @@ class AnotherPanePlugin(PanePlugin):
         return SampleData(value=100, source="another")
 
     def render_tui(self, data: MetricData) -> Any:
-        return MagicMock()
+        return _RENDER_SENTINEL
 
     def get_schema(self) -> type[BaseModel]:
         return SampleData
@@ -70,20 +178,22 @@ class PluginWithLifecycle(PanePlugin):
         super().__init__()
         self.started = False
         self.stopped = False
-        self.inject_calls: list[dict] = []
+        self.inject_count = 0
+        self.last_inject: dict[str, Any] | None = None
 
     async def collect_data(self) -> SampleData:
         return SampleData(value=1, source="lifecycle")
 
     def render_tui(self, data: MetricData) -> Any:
-        return MagicMock()
+        return _RENDER_SENTINEL
 
     def get_schema(self) -> type[BaseModel]:
         return SampleData
 
     def inject(self, **kwargs: Any) -> None:
         """Track dependency injection calls."""
-        self.inject_calls.append(kwargs)
+        self.inject_count += 1
+        self.last_inject = kwargs
 
     def start(self) -> None:
         """Track start calls."""
@@ -94,6 +204,31 @@ class PluginWithLifecycle(PanePlugin):
         self.stopped = True
 
 
+class StopOrderPlugin(PluginWithLifecycle):
+    """Plugin that records the order in which plugins are stopped."""
+
+    stop_order: ClassVar[list[str]] = []
+
+    def stop(self) -> None:
+        """Record this plugin's name in the shared stop order."""
+        super().stop()
+        self.stop_order.append(self.name)
+
+
+class FirstStopOrderPlugin(StopOrderPlugin):
+    """First plugin registered in the stop order test."""
+
+    name = "plugin1"
+    display_name = "Plugin 1"
+
+
+class SecondStopOrderPlugin(StopOrderPlugin):
+    """Second plugin registered in the stop order test."""
+
+    name = "plugin2"
+    display_name = "Plugin 2"
+
+
 class FailingPlugin(PanePlugin):
     """Plugin that fails during initialization."""
 
@@ -107,7 +242,7 @@ class FailingPlugin(PanePlugin):
         return SampleData(value=0, source="failing")
 
     def render_tui(self, data: MetricData) -> Any:
-        return MagicMock()
+        return _RENDER_SENTINEL
 
     def get_schema(self) -> type[BaseModel]:
         return SampleData
@@ -150,66 +285,66 @@ class SampleActionPlugin(ActionPlugin):
         return {"success": True}
 
 
+# Each PluginError subclass with a message to raise it with
+_PLUGIN_ERROR_CASES: list[tuple[type[PluginError], str]] = [
+    (PluginLoadError, "load failed"),
+    (PluginNotFoundError, "not found"),
+    (PluginConflictError, "conflict"),
+    (PluginValidationError, "validation failed"),
+    (PluginInitializationError, "init failed"),
+    (PluginLifecycleError, "lifecycle error"),
+]
+
+
 class TestPluginExceptions:
     """Tests for plugin exception hierarchy."""
 
     def test_plugin_error_is_base(self) -> None:
         """Test PluginError is the base exception."""
-        assert issubclass(PluginLoadError, PluginError)
-        assert issubclass(PluginNotFoundError, PluginError)
-        assert issubclass(PluginConflictError, PluginError)
-        assert issubclass(PluginValidationError, PluginError)
-        assert issubclass(PluginInitializationError, PluginError)
-        assert issubclass(PluginLifecycleError, PluginError)
-
-    def test_exceptions_can_be_raised(self) -> None:
-        """Test exceptions can be raised with messages."""
-        with pytest.raises(PluginLoadError, match="load failed"):
-            raise PluginLoadError("load failed")
-
-        with pytest.raises(PluginNotFoundError, match="not found"):
-            raise PluginNotFoundError("not found")
+        assert all(issubclass(exc_cls, PluginError) for exc_cls, _ in _PLUGIN_ERROR_CASES)
 
-        with pytest.raises(PluginConflictError, match="conflict"):
-            raise PluginConflictError("conflict")
-
-        with pytest.raises(PluginValidationError, match="validation"):
-            raise PluginValidationError("validation failed")
-
-        with pytest.raises(PluginInitializationError, match="init"):
-            raise PluginInitializationError("init failed")
-
-        with pytest.raises(PluginLifecycleError, match="lifecycle"):
-            raise PluginLifecycleError("lifecycle error")
-
-    def test_exception_with_plugin_name(self) -> None:
-        """Test exceptions include plugin name in string representation."""
-        error = PluginLoadError("load failed", plugin_name="test_plugin")
-        assert "test_plugin" in str(error)
-        assert "load failed" in str(error)
-        assert error.plugin_name == "test_plugin"
-
-    def test_exception_with_cause(self) -> None:
-        """Test exceptions include cause information."""
-        cause = ValueError("underlying error")
-        error = PluginLoadError("load failed", cause=cause)
-        assert "caused by" in str(error)
-        assert "underlying error" in str(error)
+    @pytest.mark.parametrize(("exc_cls", "message"), _PLUGIN_ERROR_CASES)
+    def test_exceptions_can_be_raised(self, exc_cls: type[PluginError], message: str) -> None:
+        """Test exceptions can be raised with messages."""
+        with pytest.raises(exc_cls, match=message):
+            raise exc_cls(message)
+
+    @pytest.mark.parametrize(
+        ("exc_cls", "message", "plugin_name", "cause", "expected"),
+        [
+            (PluginLoadError, "load failed", None, None, "load failed"),
+            (PluginLoadError, "load failed", "test_plugin", None, "[test_plugin] load failed"),
+            (
+                PluginLoadError,
+                "load failed",
+                None,
+                ValueError("underlying error"),
+                "load failed (caused by: underlying error)",
+            ),
+            (
+                PluginValidationError,
+                "validation failed",
+                "my_plugin",
+                RuntimeError("root cause"),
+                "[my_plugin] validation failed (caused by: root cause)",
+            ),
+        ],
+    )
+    def test_exception_rendering(
+        self,
+        exc_cls: type[PluginError],
+        message: str,
+        plugin_name: str | None,
+        cause: Exception | None,
+        expected: str,
+    ) -> None:
+        """Test exceptions render plugin name and cause around the message."""
+        error = exc_cls(message, plugin_name=plugin_name, cause=cause)
+
+        assert str(error) == expected
+        assert error.plugin_name == plugin_name
         assert error.cause is cause
 
-    def test_exception_full_context(self) -> None:
-        """Test exceptions with both plugin name and cause."""
-        cause = RuntimeError("root cause")
-        error = PluginValidationError(
-            "validation failed",
-            plugin_name="my_plugin",
-            cause=cause,
-        )
-        error_str = str(error)
-        assert "[my_plugin]" in error_str
-        assert "validation failed" in error_str
-        assert "root cause" in error_str
-
 
 class TestPluginRegistry:
     """Tests for PluginRegistry class."""
@@ -226,15 +361,13 @@ class TestPluginRegistry:
         registry = PluginRegistry(plugin_dir=custom_dir)
         assert registry.plugin_dir == custom_dir
 
-    def test_empty_registry(self) -> None:
+    def test_empty_registry(self, registry: PluginRegistry) -> None:
         """Test empty registry state."""
-        registry = PluginRegistry()
         assert len(registry) == 0
         assert "nonexistent" not in registry
 
-    def test_register_plugin(self) -> None:
+    def test_register_plugin(self, registry: PluginRegistry) -> None:
         """Test manual plugin registration."""
-        registry = PluginRegistry()
         plugin = SamplePanePlugin()
 
         registry.register(plugin)
@@ -242,9 +375,8 @@ class TestPluginRegistry:
         assert len(registry) == 1
         assert "sample_pane" in registry
 
-    def test_register_duplicate_raises(self) -> None:
+    def test_register_duplicate_raises(self, registry: PluginRegistry) -> None:
         """Test registering duplicate plugin raises error."""
-        registry = PluginRegistry()
         plugin1 = SamplePanePlugin()
         plugin2 = SamplePanePlugin()
 
@@ -253,25 +385,21 @@ class TestPluginRegistry:
         with pytest.raises(PluginConflictError, match="sample_pane"):
             registry.register(plugin2)
 
-    def test_get_plugin(self) -> None:
+    def test_get_plugin(self, registry: PluginRegistry) -> None:
         """Test getting plugin by name."""
-        registry = PluginRegistry()
         plugin = SamplePanePlugin()
         registry.register(plugin)
 
         result = registry.get("sample_pane")
         assert result is plugin
 
-    def test_get_nonexistent_raises(self) -> None:
+    def test_get_nonexistent_raises(self, registry: PluginRegistry) -> None:
         """Test getting nonexistent plugin raises error."""
-        registry = PluginRegistry()
-
         with pytest.raises(PluginNotFoundError, match="nonexistent"):
             registry.get("nonexistent")
 
-    def test_get_pane(self) -> None:
+    def test_get_pane(self, registry: PluginRegistry) -> None:
         """Test getting pane plugin specifically."""
-        registry = PluginRegistry()
         plugin = SamplePanePlugin()
         registry.register(plugin)
 
@@ -279,9 +407,8 @@ class TestPluginRegistry:
         assert result is plugin
         assert isinstance(result, PanePlugin)
 
-    def test_unregister(self) -> None:
+    def test_unregister(self, registry: PluginRegistry) -> None:
         """Test unregistering a plugin."""
-        registry = PluginRegistry()
         plugin = SamplePanePlugin()
         registry.register(plugin)
 
@@ -290,16 +417,13 @@ class TestPluginRegistry:
         assert len(registry) == 0
         assert "sample_pane" not in registry
 
-    def test_unregister_nonexistent_raises(self) -> None:
+    def test_unregister_nonexistent_raises(self, registry: PluginRegistry) -> None:
         """Test unregistering nonexistent plugin raises error."""
-        registry = PluginRegistry()
-
         with pytest.raises(PluginNotFoundError):
             registry.unregister("nonexistent")
 
-    def test_unregister_calls_shutdown(self) -> None:
+    def test_unregister_calls_shutdown(self, registry: PluginRegistry) -> None:
         """Test unregistering calls plugin shutdown."""
-        registry = PluginRegistry()
         plugin = SamplePanePlugin()
         plugin.initialize()
         registry.register(plugin)
@@ -310,33 +434,22 @@ class TestPluginRegistry:
 
         assert plugin._initialized is False
 
-    def test_get_plugins_by_type(self) -> None:
+    def test_get_plugins_by_type(self, shared_two_pane_registry: PluginRegistry) -> None:
         """Test getting plugins filtered by type."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-        registry.register(AnotherPanePlugin())
-
-        panes = registry.get_plugins_by_type(PluginType.PANE)
+        panes = shared_two_pane_registry.get_plugins_by_type(PluginType.PANE)
 
         assert len(panes) == 2
         assert all(isinstance(p, PanePlugin) for p in panes)
 
-    def test_get_all_metadata(self) -> None:
+    def test_get_all_metadata(self, shared_two_pane_registry: PluginRegistry) -> None:
         """Test getting all plugin metadata."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-        registry.register(AnotherPanePlugin())
-
-        metadata = registry.get_all_metadata()
+        metadata = shared_two_pane_registry.get_all_metadata()
 
         assert len(metadata) == 2
-        names = [m.name for m in metadata]
-        assert "sample_pane" in names
-        assert "another_pane" in names
+        assert {m.name for m in metadata} == {"sample_pane", "another_pane"}
 
-    def test_get_enabled_plugins(self) -> None:
+    def test_get_enabled_plugins(self, registry: PluginRegistry) -> None:
         """Test getting only enabled plugins."""
-        registry = PluginRegistry()
         plugin1 = SamplePanePlugin()
         plugin2 = AnotherPanePlugin()
         plugin2.enabled = False
@@ -349,9 +462,8 @@ class TestPluginRegistry:
         assert len(enabled) == 1
         assert enabled[0].name == "sample_pane"
 
-    def test_initialize_all(self) -> None:
+    def test_initialize_all(self, registry: PluginRegistry) -> None:
         """Test initializing all plugins with config."""
-        registry = PluginRegistry()
         plugin1 = SamplePanePlugin()
         plugin2 = AnotherPanePlugin()
 
@@ -369,9 +481,8 @@ class TestPluginRegistry:
         assert plugin2._initialized is True
         assert plugin2.config == {"option": "value2"}
 
-    def test_shutdown_all(self) -> None:
+    def test_shutdown_all(self, registry: PluginRegistry) -> None:
         """Test shutting down all plugins."""
-        registry = PluginRegistry()
         plugin1 = SamplePanePlugin()
         plugin2 = AnotherPanePlugin()
 
@@ -404,57 +515,28 @@ class TestPluginRegistry:
 class TestPluginDiscoveryFromDirectory:
     """Tests for directory-based plugin discovery."""
 
-    def test_discover_plugin_from_file(self, tmp_path: Path) -> None:
+    def test_discover_plugin_from_file(self, prebuilt_plugin_dir: Path) -> None:
         """Test discovering a plugin from a .py file."""
-        plugin_code = """
-from typing import Any
-from pydantic import BaseModel
-from uptop.models import MetricData
-from uptop.plugin_api import PanePlugin
-
-
-class TestData(MetricData):
-    test_value: str = "test"
-
-
-class DirectoryTestPlugin(PanePlugin):
-    name = "directory_test"
-    display_name = "Directory Test Plugin"
-
-    async def collect_data(self) -> TestData:
-        return TestData(source="test")
-
-    def render_tui(self, data: MetricData) -> Any:
-        return None
-
-    def get_schema(self) -> type[BaseModel]:
-        return TestData
-"""
-        plugin_file = tmp_path / "test_plugin.py"
-        plugin_file.write_text(plugin_code)
-
-        registry = PluginRegistry(plugin_dir=tmp_path)
+        registry = PluginRegistry(plugin_dir=prebuilt_plugin_dir)
         discovered = registry.discover_all()
 
         # Should have found our plugin
         names = [m.name for m in discovered]
         assert "directory_test" in names
 
-    def test_skip_underscore_files(self, tmp_path: Path) -> None:
+    def test_skip_underscore_files(self, prebuilt_plugin_dir: Path) -> None:
         """Test that files starting with _ are skipped."""
-        plugin_file = tmp_path / "_private_plugin.py"
-        plugin_file.write_text("# This should be skipped")
-
-        registry = PluginRegistry(plugin_dir=tmp_path)
+        registry = PluginRegistry(plugin_dir=prebuilt_plugin_dir)
         discovered = registry.discover_all()
 
         # Should not have loaded the _private file
         assert all("_private" not in m.name for m in discovered)
+        assert "_private_plugin" not in registry.failed_plugins
 
     def test_handle_invalid_plugin_file(self, tmp_path: Path) -> None:
         """Test graceful handling of invalid plugin files."""
         invalid_file = tmp_path / "invalid_plugin.py"
-        invalid_file.write_text("this is not valid python {{{")
+        invalid_file.write_text(_INVALID_PLUGIN_CODE)
 
         registry = PluginRegistry(plugin_dir=tmp_path)
         # Should not raise, just log error
@@ -464,40 +546,9 @@ class DirectoryTestPlugin(PanePlugin):
         # Should have recorded the failure
         assert len(registry.failed_plugins) > 0
 
-    def test_discover_plugin_package(self, tmp_path: Path) -> None:
+    def test_discover_plugin_package(self, prebuilt_plugin_dir: Path) -> None:
         """Test discovering a plugin from a subdirectory package."""
-        # Create a package directory with __init__.py
-        package_dir = tmp_path / "my_plugin"
-        package_dir.mkdir()
-
-        plugin_code = """
-from typing import Any
-from pydantic import BaseModel
-from uptop.models import MetricData
-from uptop.plugin_api import PanePlugin
-
-
-class PackageData(MetricData):
-    pkg_value: str = "pkg"
-
-
-class PackagePlugin(PanePlugin):
-    name = "package_plugin"
-    display_name = "Package Plugin"
-
-    async def collect_data(self) -> PackageData:
-        return PackageData(source="package")
-
-    def render_tui(self, data: MetricData) -> Any:
-        return None
-
-    def get_schema(self) -> type[BaseModel]:
-        return PackageData
-"""
-        init_file = package_dir / "__init__.py"
-        init_file.write_text(plugin_code)
-
-        registry = PluginRegistry(plugin_dir=tmp_path)
+        registry = PluginRegistry(plugin_dir=prebuilt_plugin_dir)
         discovered = registry.discover_all()
 
         names = [m.name for m in discovered]
@@ -506,7 +557,7 @@ class PackagePlugin(PanePlugin):
     def test_strict_mode_raises_on_error(self, tmp_path: Path) -> None:
         """Test that strict mode raises exceptions instead of logging."""
         invalid_file = tmp_path / "bad_plugin.py"
-        invalid_file.write_text("this is not valid python {{{")
+        invalid_file.write_text(_INVALID_PLUGIN_CODE)
 
         registry = PluginRegistry(plugin_dir=tmp_path)
 
@@ -517,9 +568,8 @@ class PackagePlugin(PanePlugin):
 class TestPluginLifecycle:
     """Tests for plugin lifecycle management."""
 
-    def test_lifecycle_methods_called(self) -> None:
+    def test_lifecycle_methods_called(self, registry: PluginRegistry) -> None:
         """Test that lifecycle methods are called in order."""
-        registry = PluginRegistry()
         plugin = PluginWithLifecycle()
         registry.register(plugin)
 
@@ -539,21 +589,19 @@ class TestPluginLifecycle:
         registry.shutdown_all()
         assert plugin._initialized is False
 
-    def test_dependency_injection(self) -> None:
+    def test_dependency_injection(self, registry: PluginRegistry) -> None:
         """Test that dependencies are injected during initialization."""
-        registry = PluginRegistry()
         plugin = PluginWithLifecycle()
         registry.register(plugin)
 
         dependencies = {"app": "mock_app", "scheduler": "mock_scheduler"}
         registry.initialize_all(dependencies=dependencies)
 
-        assert len(plugin.inject_calls) == 1
-        assert plugin.inject_calls[0] == dependencies
+        assert plugin.inject_count == 1
+        assert plugin.last_inject == dependencies
 
-    def test_initialize_all_returns_failed(self) -> None:
+    def test_initialize_all_returns_failed(self, registry: PluginRegistry) -> None:
         """Test that initialize_all returns list of failed plugins."""
-        registry = PluginRegistry()
         good_plugin = SamplePanePlugin()
         bad_plugin = FailingPlugin()
 
@@ -567,9 +615,8 @@ class TestPluginLifecycle:
         assert bad_plugin.enabled is False
         assert good_plugin.enabled is True
 
-    def test_start_skips_disabled_plugins(self) -> None:
+    def test_start_skips_disabled_plugins(self, registry: PluginRegistry) -> None:
         """Test that start_all skips disabled plugins."""
-        registry = PluginRegistry()
         plugin = PluginWithLifecycle()
         plugin.enabled = False
         registry.register(plugin)
@@ -579,38 +626,21 @@ class TestPluginLifecycle:
 
         assert plugin.started is False
 
-    def test_stop_all_in_reverse_order(self) -> None:
+    def test_stop_all_in_reverse_order(self, registry: PluginRegistry) -> None:
         """Test that stop_all processes plugins in reverse order."""
-        registry = PluginRegistry()
-        call_order: list[str] = []
-
-        # Create two plugins that track stop calls
-        class Plugin1(PluginWithLifecycle):
-            name = "plugin1"
-            display_name = "Plugin 1"
-
-            def stop(self) -> None:
-                call_order.append("plugin1")
-
-        class Plugin2(PluginWithLifecycle):
-            name = "plugin2"
-            display_name = "Plugin 2"
-
-            def stop(self) -> None:
-                call_order.append("plugin2")
+        StopOrderPlugin.stop_order.clear()
 
-        registry.register(Plugin1())
-        registry.register(Plugin2())
+        registry.register(FirstStopOrderPlugin())
+        registry.register(SecondStopOrderPlugin())
         registry.initialize_all()
         registry.start_all()
         registry.stop_all()
 
         # Should be in reverse order (plugin2 registered last, stopped first)
-        assert call_order == ["plugin2", "plugin1"]
+        assert StopOrderPlugin.stop_order == ["plugin2", "plugin1"]
 
-    def test_shutdown_stops_if_running(self) -> None:
+    def test_shutdown_stops_if_running(self, registry: PluginRegistry) -> None:
         """Test that shutdown_all calls stop_all if plugins are running."""
-        registry = PluginRegistry()
         plugin = PluginWithLifecycle()
         registry.register(plugin)
         registry.initialize_all()
@@ -624,9 +654,8 @@ class TestPluginLifecycle:
         assert plugin.stopped is True
         assert plugin._initialized is False
 
-    def test_is_initialized_property(self) -> None:
+    def test_is_initialized_property(self, registry: PluginRegistry) -> None:
         """Test the is_initialized property."""
-        registry = PluginRegistry()
         registry.register(SamplePanePlugin())
 
         assert registry.is_initialized is False
@@ -635,9 +664,8 @@ class TestPluginLifecycle:
         registry.shutdown_all()
         assert registry.is_initialized is False
 
-    def test_is_started_property(self) -> None:
+    def test_is_started_property(self, registry: PluginRegistry) -> None:
         """Test the is_started property."""
-        registry = PluginRegistry()
         plugin = PluginWithLifecycle()
         registry.register(plugin)
         registry.initialize_all()
@@ -649,12 +677,19 @@ class TestPluginLifecycle:
         assert registry.is_started is False
 
 
+@pytest.fixture(scope="class")
+def registry_with_pane() -> PluginRegistry:
+    """Provide a registry holding only SamplePanePlugin, shared by a test class."""
+    registry = PluginRegistry(plugin_dir=_DEFAULT_PLUGIN_DIR)
+    registry.register(SamplePanePlugin())
+    return registry
+
+
 class TestPluginTypeAccessors:
     """Tests for type-specific plugin accessors."""
 
-    def test_get_collector(self) -> None:
+    def test_get_collector(self, registry: PluginRegistry) -> None:
         """Test getting a collector plugin by name."""
-        registry = PluginRegistry()
         plugin = SampleCollectorPlugin()
         registry.register(plugin)
 
@@ -662,17 +697,8 @@ class TestPluginTypeAccessors:
         assert result is plugin
         assert isinstance(result, CollectorPlugin)
 
-    def test_get_collector_wrong_type_raises(self) -> None:
-        """Test that get_collector raises for non-collector."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-
-        with pytest.raises(PluginNotFoundError, match="not a CollectorPlugin"):
-            registry.get_collector("sample_pane")
-
-    def test_get_formatter(self) -> None:
+    def test_get_formatter(self, registry: PluginRegistry) -> None:
         """Test getting a formatter plugin by name."""
-        registry = PluginRegistry()
         plugin = SampleFormatterPlugin()
         registry.register(plugin)
 
@@ -680,17 +706,8 @@ class TestPluginTypeAccessors:
         assert result is plugin
         assert isinstance(result, FormatterPlugin)
 
-    def test_get_formatter_wrong_type_raises(self) -> None:
-        """Test that get_formatter raises for non-formatter."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-
-        with pytest.raises(PluginNotFoundError, match="not a FormatterPlugin"):
-            registry.get_formatter("sample_pane")
-
-    def test_get_action(self) -> None:
+    def test_get_action(self, registry: PluginRegistry) -> None:
         """Test getting an action plugin by name."""
-        registry = PluginRegistry()
         plugin = SampleActionPlugin()
         registry.register(plugin)
 
@@ -698,44 +715,42 @@ class TestPluginTypeAccessors:
         assert result is plugin
         assert isinstance(result, ActionPlugin)
 
-    def test_get_action_wrong_type_raises(self) -> None:
-        """Test that get_action raises for non-action."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-
-        with pytest.raises(PluginNotFoundError, match="not an ActionPlugin"):
-            registry.get_action("sample_pane")
+    @pytest.mark.parametrize(
+        ("method", "match"),
+        [
+            ("get_collector", "not a CollectorPlugin"),
+            ("get_formatter", "not a FormatterPlugin"),
+            ("get_action", "not an ActionPlugin"),
+        ],
+    )
+    def test_typed_getter_wrong_type_raises(
+        self, registry_with_pane: PluginRegistry, method: str, match: str
+    ) -> None:
+        """Test that typed getters raise for a plugin of another type."""
+        with pytest.raises(PluginNotFoundError, match=match):
+            getattr(registry_with_pane, method)("sample_pane")
 
 
 class TestRegistryUtilities:
     """Tests for registry utility methods."""
 
-    def test_clear(self) -> None:
+    def test_clear(self, two_pane_registry: PluginRegistry) -> None:
         """Test clearing the registry."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-        registry.register(AnotherPanePlugin())
-        registry.initialize_all()
+        two_pane_registry.initialize_all()
 
-        registry.clear()
+        two_pane_registry.clear()
 
-        assert len(registry) == 0
-        assert registry.is_initialized is False
+        assert len(two_pane_registry) == 0
+        assert two_pane_registry.is_initialized is False
 
-    def test_iter(self) -> None:
+    def test_iter(self, shared_two_pane_registry: PluginRegistry) -> None:
         """Test iterating over plugin names."""
-        registry = PluginRegistry()
-        registry.register(SamplePanePlugin())
-        registry.register(AnotherPanePlugin())
-
-        names = list(registry)
+        names = list(shared_two_pane_registry)
 
-        assert "sample_pane" in names
-        assert "another_pane" in names
+        assert {"sample_pane", "another_pane"} <= set(names)
 
-    def test_repr(self) -> None:
+    def test_repr(self, registry: PluginRegistry) -> None:
         """Test string representation."""
-        registry = PluginRegistry()
         registry.register(SamplePanePlugin())
         registry.initialize_all()
 
@@ -745,14 +760,14 @@ class TestRegistryUtilities:
         assert "plugins=1" in repr_str
         assert "initialized=True" in repr_str
 
-    def test_failed_plugins_property(self) -> None:
-        """Test the failed_plugins property returns a copy."""
-        registry = PluginRegistry()
+    def test_failed_plugins_property(self, registry: PluginRegistry) -> None:
+        """Test the failed_plugins property returns a read-only view."""
         registry.register(FailingPlugin())
         registry.initialize_all()
 
-        failed1 = registry.failed_plugins
-        failed2 = registry.failed_plugins
+        failed = registry.failed_plugins
 
-        assert failed1 == failed2
-        assert failed1 is not failed2  # Should be a copy
+        assert "failing_plugin" in failed
+        with pytest.raises(TypeError):
+            failed["other"] = "error"  # type: ignore[index]
+        assert "other" not in registry.failed_plugins
@@ -10,6 +10,10 @@ This module tests the sparkline widget functionality including:
 
 from __future__ import annotations
 
+from typing import Any
+
+import pytest
+
 from uptop.tui.widgets.sparkline import (
     SPARK_CHARS,
     Sparkline,
@@ -18,6 +22,18 @@ from uptop.tui.widgets.sparkline import (
     value_to_char,
 )
 
+# Character bands used by the membership assertions below
+_MID = frozenset(SPARK_CHARS[3:6])
+_HIGH = frozenset(SPARK_CHARS[6:9])
+_ALL_BUT_ENDS = frozenset(SPARK_CHARS[1:8])
+# Quarter-percent sweep across the 0-100 range used by the invariant tests
+_PERCENT_SWEEP = [i / 4 for i in range(401)]
+
+
+def _render(values: list[float], width: int, **kwargs: Any) -> str:
+    """Render a sparkline built from ``values`` and return it as plain text."""
+    return str(Sparkline(values=values, width=width, **kwargs).render())
+
 
 class TestValueToChar:
     """Tests for the value_to_char function."""
@@ -34,7 +50,7 @@ class TestValueToChar:
         """Test that middle value returns middle character."""
         char = value_to_char(50.0, 0.0, 100.0)
         # Should be around index 4 (middle of 0-8)
-        assert char in SPARK_CHARS[3:6]
+        assert char in _MID
 
     def test_value_below_min_clamped(self) -> None:
         """Test that values below min are clamped to min."""
@@ -48,7 +64,7 @@ class TestValueToChar:
         """Test value_to_char with custom min/max range."""
         # Mid-point of 0-50 range
         char = value_to_char(25.0, 0.0, 50.0)
-        assert char in SPARK_CHARS[3:6]
+        assert char in _MID
 
     def test_same_min_max_returns_middle(self) -> None:
         """Test that when min equals max, middle character is returned."""
@@ -57,14 +73,11 @@ class TestValueToChar:
         assert char == SPARK_CHARS[4]  # Middle character
 
     def test_all_character_levels(self) -> None:
-        """Test that different values map to different characters."""
-        chars_used = set()
-        for i in range(9):
-            value = i * 12.5  # 0, 12.5, 25, 37.5, 50, 62.5, 75, 87.5, 100
-            char = value_to_char(value, 0.0, 100.0)
-            chars_used.add(char)
-        # Should use multiple different characters
-        assert len(chars_used) >= 5
+        """Test that the 0-100 sweep maps monotonically onto the character set."""
+        indices = [SPARK_CHARS.index(value_to_char(v, 0.0, 100.0)) for v in _PERCENT_SWEEP]
+        assert indices == sorted(indices)
+        # Should use every level from the lowest to the highest character
+        assert set(indices) == set(range(len(SPARK_CHARS)))
 
 
 class TestGetValueColor:
@@ -99,6 +112,12 @@ class TestGetValueColor:
         # Exactly 80% should be red
         assert get_value_color(80.0) == "red"
 
+    def test_color_bands_over_range(self) -> None:
+        """Test every value in the 0-100 sweep falls in its threshold band."""
+        for value in _PERCENT_SWEEP:
+            expected = "green" if value < 50.0 else "yellow" if value < 80.0 else "red"
+            assert get_value_color(value) == expected, value
+
 
 class TestGetValueStyle:
     """Tests for the get_value_style function."""
@@ -187,11 +206,12 @@ class TestSparklineWidget:
     def test_history_size_limit(self) -> None:
         """Test that history respects size limit."""
         sparkline = Sparkline(history_size=5)
-        for i in range(10):
-            sparkline.add_value(float(i))
+        sparkline.add_values([float(i) for i in range(10)])
         # Should only keep the last 5 values
-        assert len(sparkline.values) == 5
         assert sparkline.values == [5.0, 6.0, 7.0, 8.0, 9.0]
+        # A single add_value on a full history drops the oldest value
+        sparkline.add_value(10.0)
+        assert sparkline.values == [6.0, 7.0, 8.0, 9.0, 10.0]
 
     def test_render_empty_data(self) -> None:
         """Test rendering with no data shows placeholder."""
@@ -202,9 +222,7 @@ class TestSparklineWidget:
 
     def test_render_single_value(self) -> None:
         """Test rendering with a single value."""
-        sparkline = Sparkline(values=[50.0], width=10)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render([50.0], 10)
         # Should have padding plus the single character
         assert len(rendered_str) == 10
         # Last character should be the sparkline char for 50%
@@ -213,72 +231,54 @@ class TestSparklineWidget:
     def test_render_full_width(self) -> None:
         """Test rendering when values fill the width."""
         values = [float(i * 10) for i in range(10)]  # 0, 10, 20, ..., 90
-        sparkline = Sparkline(values=values, width=10)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render(values, 10)
         assert len(rendered_str) == 10
         # First char should be for 0%, last should be for 90%
         assert rendered_str[0] == "_"  # 0% is underscore
-        assert rendered_str[-1] in SPARK_CHARS[6:9]  # 90% is high
-
-    def test_render_exceeds_width(self) -> None:
-        """Test that excess values are truncated to width."""
-        values = [float(i) for i in range(100)]
-        sparkline = Sparkline(values=values, width=20)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
-        # Should only show the last 20 values
-        assert len(rendered_str) == 20
+        assert rendered_str[-1] in _HIGH  # 90% is high
+
+    @pytest.mark.parametrize(
+        ("values", "width"),
+        [
+            ([50.0], 10),
+            ([float(i) for i in range(100)], 20),
+            ([45.0 + (i * 0.5) for i in range(30)], 30),
+        ],
+        ids=["padded", "truncated", "exact"],
+    )
+    def test_render_width(self, values: list[float], width: int) -> None:
+        """Test that output is padded, truncated or filled to exactly the width."""
+        assert len(_render(values, width)) == width
 
     def test_render_with_label(self) -> None:
         """Test rendering with a label."""
-        sparkline = Sparkline(
-            values=[50.0],
-            width=10,
-            show_label=True,
-            label="CPU",
-        )
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render([50.0], 10, show_label=True, label="CPU")
         assert "CPU: " in rendered_str
 
-    def test_render_max_values(self) -> None:
-        """Test rendering with all max values (100%)."""
-        values = [100.0] * 10
-        sparkline = Sparkline(values=values, width=10)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
-        # All characters should be full blocks
-        assert all(c == "\u2588" for c in rendered_str)
-
-    def test_render_min_values(self) -> None:
-        """Test rendering with all min values (0%)."""
-        values = [0.0] * 10
-        sparkline = Sparkline(values=values, width=10)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
-        # All characters should be underscores
-        assert all(c == "_" for c in rendered_str)
+    @pytest.mark.parametrize(
+        ("value", "expected_char"),
+        [(100.0, "\u2588"), (0.0, "_")],
+        ids=["max", "min"],
+    )
+    def test_render_uniform_values(self, value: float, expected_char: str) -> None:
+        """Test that a flat history renders as a single repeated character."""
+        assert _render([value] * 10, 10) == expected_char * 10
 
     def test_render_ascending_pattern(self) -> None:
         """Test rendering with ascending values."""
         values = [0.0, 25.0, 50.0, 75.0, 100.0]
-        sparkline = Sparkline(values=values, width=5)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render(values, 5)
         # Characters should increase in height
         assert rendered_str[0] == "_"  # 0%
         assert rendered_str[-1] == "\u2588"  # 100%
         # Middle characters should be intermediate
         for i in range(1, 4):
-            assert rendered_str[i] in SPARK_CHARS[1:8]
+            assert rendered_str[i] in _ALL_BUT_ENDS
 
     def test_render_descending_pattern(self) -> None:
         """Test rendering with descending values."""
         values = [100.0, 75.0, 50.0, 25.0, 0.0]
-        sparkline = Sparkline(values=values, width=5)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render(values, 5)
         # Characters should decrease in height
         assert rendered_str[0] == "\u2588"  # 100%
         assert rendered_str[-1] == "_"  # 0%
@@ -295,9 +295,7 @@ class TestSparklineIntegration:
             88.0, 75.0, 60.0, 45.0, 30.0, 25.0, 20.0, 18.0, 22.0, 35.0,
             48.0, 52.0, 45.0, 38.0, 32.0, 28.0, 25.0, 22.0, 20.0, 18.0,
         ]
-        sparkline = Sparkline(values=cpu_values, width=30)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render(cpu_values, 30)
         assert len(rendered_str) == 30
         # Should have variation in the output
         unique_chars = set(rendered_str)
@@ -307,9 +305,7 @@ class TestSparklineIntegration:
         """Test with a typical memory usage pattern (slowly increasing)."""
         # Memory tends to increase slowly over time
         memory_values = [45.0 + (i * 0.5) for i in range(60)]
-        sparkline = Sparkline(values=memory_values, width=30, history_size=60)
-        rendered = sparkline.render()
-        rendered_str = str(rendered)
+        rendered_str = _render(memory_values, 30, history_size=60)
         assert len(rendered_str) == 30
 
     def test_color_changes_with_last_value(self) -> None:
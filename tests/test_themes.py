@@ -1,5 +1,8 @@
 """Tests for uptop theming system."""
 
+import dataclasses
+import re
+
 import pytest
 
 from uptop.config import Config, TUIConfig
@@ -22,35 +25,73 @@ from uptop.tui.themes import (
     list_themes,
 )
 
+# A color value must be exactly "#" followed by six hex digits
+_HEX_COLOR_RE = re.compile(r"\A#[0-9a-fA-F]{6}\Z")
+
+# Every ThemeColors field, kept in sync with the dataclass
+_COLOR_FIELDS = tuple(field.name for field in dataclasses.fields(ThemeColors))
+
+
+# Tokens every generated theme stylesheet must contain, each found in one regex pass
+_CSS_VARIABLES = (
+    "$background:",
+    "$foreground:",
+    "$accent:",
+    "$border:",
+    "$success:",
+    "$warning:",
+    "$error:",
+)
+_CSS_VARIABLES_RE = re.compile("|".join(map(re.escape, _CSS_VARIABLES)))
+_CSS_WIDGETS = ("Screen {", "DataTable", "ProgressBar", "Button", "Input")
+_CSS_WIDGETS_RE = re.compile("|".join(map(re.escape, _CSS_WIDGETS)))
+_CSS_STRUCTURE = frozenset({"{", "}", "Screen"})
+_CSS_STRUCTURE_RE = re.compile(r"[{}]|Screen")
+_EXPECTED_THEMES = frozenset({"dark", "light", "solarized", "nord", "gruvbox"})
+
+# ThemeColors is frozen, so a single sample palette can be shared between tests
+_SAMPLE_COLORS = ThemeColors(
+    background="#000000",
+    background_secondary="#111111",
+    foreground="#ffffff",
+    foreground_muted="#cccccc",
+    accent="#0000ff",
+    accent_secondary="#0088ff",
+    border="#333333",
+    border_focused="#0000ff",
+    success="#00ff00",
+    warning="#ffff00",
+    error="#ff0000",
+    info="#00ffff",
+    table_header="#222222",
+    table_row_odd="#000000",
+    table_row_even="#111111",
+    scrollbar="#222222",
+    scrollbar_thumb="#444444",
+    progress_bar="#0000ff",
+    progress_bar_background="#222222",
+)
+
+
+@pytest.fixture(scope="module")
+def theme_css_cache() -> dict[str, str]:
+    """Generate each built-in theme's CSS once for the tests that only read it."""
+    return {name: get_theme_css(name) for name in AVAILABLE_THEMES}
+
+
+@pytest.fixture(scope="module")
+def themes() -> dict[str, Theme]:
+    """Look up each built-in theme once for the tests that only inspect it."""
+    return {name: get_theme(name) for name in AVAILABLE_THEMES}
+
 
 class TestThemeColors:
     """Tests for ThemeColors dataclass."""
 
     def test_theme_colors_immutable(self) -> None:
         """Test that ThemeColors is immutable (frozen)."""
-        colors = ThemeColors(
-            background="#000000",
-            background_secondary="#111111",
-            foreground="#ffffff",
-            foreground_muted="#cccccc",
-            accent="#0000ff",
-            accent_secondary="#0088ff",
-            border="#333333",
-            border_focused="#0000ff",
-            success="#00ff00",
-            warning="#ffff00",
-            error="#ff0000",
-            info="#00ffff",
-            table_header="#222222",
-            table_row_odd="#000000",
-            table_row_even="#111111",
-            scrollbar="#222222",
-            scrollbar_thumb="#444444",
-            progress_bar="#0000ff",
-            progress_bar_background="#222222",
-        )
         with pytest.raises(AttributeError):
-            colors.background = "#ffffff"  # type: ignore[misc]
+            _SAMPLE_COLORS.background = "#ffffff"  # type: ignore[misc]
 
     def test_theme_colors_has_all_required_fields(self) -> None:
         """Test that ThemeColors requires all color fields."""
@@ -67,10 +108,9 @@ class TestTheme:
         with pytest.raises(AttributeError):
             theme.name = "modified"  # type: ignore[misc]
 
-    def test_theme_has_required_attributes(self) -> None:
+    def test_theme_has_required_attributes(self, themes: dict[str, Theme]) -> None:
         """Test that themes have all required attributes."""
-        for theme_name in AVAILABLE_THEMES:
-            theme = get_theme(theme_name)
+        for theme in themes.values():
             assert hasattr(theme, "name")
             assert hasattr(theme, "display_name")
             assert hasattr(theme, "description")
@@ -123,67 +163,35 @@ class TestBuiltInThemes:
         assert GRUVBOX_THEME.name == "gruvbox"
         assert GRUVBOX_THEME.is_dark is True
 
-    def test_all_themes_have_valid_colors(self) -> None:
-        """Test all themes have valid hex color values."""
-        hex_pattern = r"^#[0-9a-fA-F]{6}$"
-        import re
-
-        for theme_name in AVAILABLE_THEMES:
-            theme = get_theme(theme_name)
-            colors = theme.colors
-            # Check all color fields are valid hex
-            for field_name in [
-                "background",
-                "background_secondary",
-                "foreground",
-                "foreground_muted",
-                "accent",
-                "accent_secondary",
-                "border",
-                "border_focused",
-                "success",
-                "warning",
-                "error",
-                "info",
-                "table_header",
-                "table_row_odd",
-                "table_row_even",
-                "scrollbar",
-                "scrollbar_thumb",
-                "progress_bar",
-                "progress_bar_background",
-            ]:
-                color = getattr(colors, field_name)
-                assert re.match(
-                    hex_pattern, color
-                ), f"Theme '{theme_name}' has invalid color for {field_name}: {color}"
-
-    def test_theme_colors_match_guidelines(self) -> None:
+    @pytest.mark.parametrize("theme_name", AVAILABLE_THEMES)
+    def test_theme_colors_valid(self, theme_name: str) -> None:
+        """Test each theme has valid hex color values."""
+        colors = get_theme(theme_name).colors
+        # Check all color fields are valid hex
+        for field_name in _COLOR_FIELDS:
+            color = getattr(colors, field_name)
+            assert _HEX_COLOR_RE.match(
+                color
+            ), f"Theme '{theme_name}' has invalid color for {field_name}: {color}"
+
+    @pytest.mark.parametrize(
+        ("theme", "background", "foreground", "accent"),
+        [
+            (DARK_THEME, "#1e1e2e", "#cdd6f4", "#89b4fa"),
+            (LIGHT_THEME, "#eff1f5", "#4c4f69", "#1e66f5"),
+            (SOLARIZED_THEME, "#002b36", "#839496", "#268bd2"),
+            (NORD_THEME, "#2e3440", "#eceff4", "#88c0d0"),
+            (GRUVBOX_THEME, "#282828", "#ebdbb2", "#fabd2f"),
+        ],
+        ids=lambda value: value.name if isinstance(value, Theme) else None,
+    )
+    def test_theme_colors_match_guidelines(
+        self, theme: Theme, background: str, foreground: str, accent: str
+    ) -> None:
         """Test theme colors match the specified guidelines."""
-        # Dark theme
-        assert DARK_THEME.colors.background == "#1e1e2e"
-        assert DARK_THEME.colors.foreground == "#cdd6f4"
-        assert DARK_THEME.colors.accent == "#89b4fa"
-
-        # Light theme
-        assert LIGHT_THEME.colors.background == "#eff1f5"
-        assert LIGHT_THEME.colors.foreground == "#4c4f69"
-        assert LIGHT_THEME.colors.accent == "#1e66f5"
-
-        # Solarized theme
-        assert SOLARIZED_THEME.colors.background == "#002b36"
-        assert SOLARIZED_THEME.colors.foreground == "#839496"
-        assert SOLARIZED_THEME.colors.accent == "#268bd2"
-
-        # Nord theme
-        assert NORD_THEME.colors.background == "#2e3440"
-        assert NORD_THEME.colors.foreground == "#eceff4"
-        assert NORD_THEME.colors.accent == "#88c0d0"
-
-        # Gruvbox theme
-        assert GRUVBOX_THEME.colors.background == "#282828"
-        assert GRUVBOX_THEME.colors.foreground == "#ebdbb2"
-        assert GRUVBOX_THEME.colors.accent == "#fabd2f"
+        assert theme.colors.background == background
+        assert theme.colors.foreground == foreground
+        assert theme.colors.accent == accent
 
 
 class TestGetTheme:
@@ -208,19 +216,17 @@ class TestGetTheme:
         theme = get_theme("DARK")  # Uppercase should not match
         assert theme.name == "dark"  # Falls back to default
 
-    def test_get_all_available_themes(self) -> None:
+    def test_get_all_available_themes(self, themes: dict[str, Theme]) -> None:
         """Test all available themes can be retrieved."""
-        for theme_name in AVAILABLE_THEMES:
-            theme = get_theme(theme_name)
-            assert theme.name == theme_name
+        assert [theme.name for theme in themes.values()] == list(AVAILABLE_THEMES)
 
 
 class TestGetThemeCss:
     """Tests for get_theme_css function."""
 
-    def test_get_css_for_existing_theme(self) -> None:
+    def test_get_css_for_existing_theme(self, theme_css_cache: dict[str, str]) -> None:
         """Test getting CSS for an existing theme."""
-        css = get_theme_css("dark")
+        css = theme_css_cache["dark"]
         assert isinstance(css, str)
         assert len(css) > 0
         assert "uptop theme: dark" in css
@@ -230,25 +236,15 @@ class TestGetThemeCss:
         css = get_theme_css("nonexistent")
         assert "uptop theme: dark" in css
 
-    def test_css_contains_color_variables(self) -> None:
+    def test_css_contains_color_variables(self, theme_css_cache: dict[str, str]) -> None:
         """Test generated CSS contains expected color variables."""
-        css = get_theme_css("dark")
-        assert "$background:" in css
-        assert "$foreground:" in css
-        assert "$accent:" in css
-        assert "$border:" in css
-        assert "$success:" in css
-        assert "$warning:" in css
-        assert "$error:" in css
-
-    def test_css_contains_widget_styles(self) -> None:
+        css = theme_css_cache["dark"]
+        assert set(_CSS_VARIABLES_RE.findall(css)) == set(_CSS_VARIABLES)
+
+    def test_css_contains_widget_styles(self, theme_css_cache: dict[str, str]) -> None:
         """Test generated CSS contains widget styles."""
-        css = get_theme_css("dark")
-        assert "Screen {" in css
-        assert "DataTable" in css
-        assert "ProgressBar" in css
-        assert "Button" in css
-        assert "Input" in css
+        css = theme_css_cache["dark"]
+        assert set(_CSS_WIDGETS_RE.findall(css)) == set(_CSS_WIDGETS)
 
 
 class TestGenerateThemeCss:
@@ -317,13 +313,7 @@ class TestListThemes:
 
     def test_list_themes_includes_expected(self) -> None:
         """Test list_themes includes expected themes."""
-        themes = list_themes()
-        theme_names = [t[0] for t in themes]
-        assert "dark" in theme_names
-        assert "light" in theme_names
-        assert "solarized" in theme_names
-        assert "nord" in theme_names
-        assert "gruvbox" in theme_names
+        assert {name for name, _, _ in list_themes()} >= _EXPECTED_THEMES
 
 
 class TestIsValidTheme:
@@ -368,9 +358,7 @@ class TestAvailableThemes:
 
     def test_available_themes_contains_expected(self) -> None:
         """Test AVAILABLE_THEMES contains all expected themes."""
-        expected = ["dark", "light", "solarized", "nord", "gruvbox"]
-        for theme in expected:
-            assert theme in AVAILABLE_THEMES
+        assert frozenset(AVAILABLE_THEMES) >= _EXPECTED_THEMES
 
     def test_available_themes_count(self) -> None:
         """Test correct number of themes."""
@@ -380,27 +368,26 @@ class TestAvailableThemes:
 class TestThemeIntegration:
     """Integration tests for theming system."""
 
-    def test_all_themes_generate_valid_css(self) -> None:
-        """Test all themes generate syntactically reasonable CSS."""
-        for theme_name in AVAILABLE_THEMES:
-            css = get_theme_css(theme_name)
-            # Basic CSS structure checks
-            assert "{" in css
-            assert "}" in css
-            # Should have screen styling
-            assert "Screen" in css
-            # Should reference theme name
-            assert theme_name in css
-
-    def test_theme_round_trip(self) -> None:
+    @pytest.mark.parametrize("theme_name", AVAILABLE_THEMES)
+    def test_theme_generates_valid_css(
+        self, theme_css_cache: dict[str, str], theme_name: str
+    ) -> None:
+        """Test each theme generates syntactically reasonable CSS."""
+        css = theme_css_cache[theme_name]
+        # Braces and screen styling, all found in one scan
+        assert set(_CSS_STRUCTURE_RE.findall(css)) == _CSS_STRUCTURE
+        # Should reference theme name
+        assert theme_name in css
+
+    @pytest.mark.parametrize("theme_name", AVAILABLE_THEMES)
+    def test_theme_round_trip(self, theme_name: str) -> None:
         """Test theme can be retrieved after being registered."""
-        for theme_name in AVAILABLE_THEMES:
-            # Get theme
-            theme = get_theme(theme_name)
-            # Theme name should match
-            assert theme.name == theme_name
-            # Colors should be accessible
-            assert theme.colors.background is not None
-            # CSS should be generatable
-            css = generate_theme_css(theme)
-            assert len(css) > 100  # Non-trivial CSS
+        # Get theme
+        theme = get_theme(theme_name)
+        # Theme name should match
+        assert theme.name == theme_name
+        # Colors should be accessible
+        assert theme.colors.background is not None
+        # CSS should be generatable
+        css = generate_theme_css(theme)
+        assert len(css) > 100  # Non-trivial CSS